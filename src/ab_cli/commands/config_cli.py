@@ -11,31 +11,31 @@ Usage:
     ab config edit              Open config in editor
 """
 import argparse
+import functools
 import json
 import os
 import subprocess
 import sys
 
-from ab_cli.core.config import get_config, AB_CONFIG_FILE, DEFAULT_CONFIG
+from ab_cli.core import config as config_module
 
 
 def cmd_show(args):
     """Display current configuration."""
-    config = get_config()
+    config = config_module.get_config()
 
     if config.config_exists():
-        data = config.to_dict()
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(config.to_json())
     else:
-        print(f"No configuration file found at {AB_CONFIG_FILE}")
+        print(f"No configuration file found at {config_module.AB_CONFIG_FILE}")
         print("Using default configuration:")
-        print(json.dumps(DEFAULT_CONFIG, indent=2, ensure_ascii=False))
+        print(json.dumps(config_module.DEFAULT_CONFIG, indent=2, ensure_ascii=False))
         print("\nRun 'ab config init' to create a config file.")
 
 
 def cmd_get(args):
     """Get a specific config value."""
-    config = get_config()
+    config = config_module.get_config()
     value = config.get(args.key)
 
     if value is None:
@@ -54,12 +54,12 @@ def cmd_get(args):
 
 def cmd_set(args):
     """Set a config value."""
-    config = get_config()
+    config = config_module.get_config()
 
     # Auto-init if config doesn't exist
     if not config.config_exists():
         config.init_config()
-        print(f"Created config file at {AB_CONFIG_FILE}")
+        print(f"Created config file at {config_module.AB_CONFIG_FILE}")
 
     # Try to parse value as JSON for complex types
     value = args.value
@@ -81,17 +81,17 @@ def cmd_set(args):
 
 def cmd_init(args):
     """Create default configuration file."""
-    config = get_config()
+    config = config_module.get_config()
 
     if config.config_exists() and not args.force:
-        print(f"Config already exists at {AB_CONFIG_FILE}")
+        print(f"Config already exists at {config_module.AB_CONFIG_FILE}")
         print("Use --force to overwrite.")
         sys.exit(1)
 
     if config.config_exists():
         # Backup existing
-        backup_path = str(AB_CONFIG_FILE) + ".bak"
-        os.rename(AB_CONFIG_FILE, backup_path)
+        backup_path = str(config_module.AB_CONFIG_FILE) + ".bak"
+        os.rename(config_module.AB_CONFIG_FILE, backup_path)
         print(f"Backed up existing config to {backup_path}")
 
     # Reset singleton to force reload
@@ -99,24 +99,24 @@ def cmd_init(args):
     config._config = {}
 
     config.init_config()
-    print(f"Created default config at {AB_CONFIG_FILE}")
+    print(f"Created default config at {config_module.AB_CONFIG_FILE}")
 
 
 def cmd_path(args):
     """Show config file path."""
-    print(AB_CONFIG_FILE)
+    print(config_module.AB_CONFIG_FILE)
 
 
 def cmd_edit(args):
     """Open config in editor."""
-    config = get_config()
+    config = config_module.get_config()
 
     if not config.config_exists():
         config.init_config()
-        print(f"Created config file at {AB_CONFIG_FILE}")
+        print(f"Created config file at {config_module.AB_CONFIG_FILE}")
 
     editor = os.environ.get('EDITOR', os.environ.get('VISUAL', 'nano'))
-    subprocess.run([editor, str(AB_CONFIG_FILE)])
+    subprocess.run([editor, str(config_module.AB_CONFIG_FILE)])
 
 
 def cmd_list_keys(args):
@@ -131,21 +131,19 @@ def cmd_list_keys(args):
                 keys.append(key)
         return keys
 
-    for key in sorted(list_keys(DEFAULT_CONFIG)):
+    for key in sorted(list_keys(config_module.DEFAULT_CONFIG)):
         print(key)
 
 
 def cmd_clear_history(args):
     """Clear LLM interaction history."""
-    from ab_cli.core.config import AB_HISTORY_DIR
-
-    if not AB_HISTORY_DIR.exists():
+    if not config_module.AB_HISTORY_DIR.exists():
         print("No history directory found.")
         return
 
     # Count files
-    history_files = list(AB_HISTORY_DIR.glob("history_*.json"))
-    index_file = AB_HISTORY_DIR / "index.json"
+    history_files = list(config_module.AB_HISTORY_DIR.glob("history_*.json"))
+    index_file = config_module.AB_HISTORY_DIR / "index.json"
 
     total_files = len(history_files) + (1 if index_file.exists() else 0)
 
@@ -178,7 +176,9 @@ def cmd_clear_history(args):
     print(f"Deleted {deleted} history files.")
 
 
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description='Manage ab CLI configuration',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -229,6 +229,11 @@ Keys use dot notation: global.language, models.small, etc.
     clear_history_parser.add_argument(
         '-y', '--yes', action='store_true', help='Skip confirmation prompt')
 
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
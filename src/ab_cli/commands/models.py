@@ -15,21 +15,37 @@ import argparse
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from ab_cli.core.config import get_config
 
-# ANSI color codes
-RED = '\033[0;31m'
-GREEN = '\033[0;32m'
-YELLOW = '\033[1;33m'
-BLUE = '\033[0;34m'
-CYAN = '\033[0;36m'
-BOLD = '\033[1m'
-DIM = '\033[2m'
-NC = '\033[0m'  # No Color
+
+def _use_color(stream=sys.stdout) -> bool:
+    """Whether to emit ANSI colors: only on a terminal, and never with NO_COLOR set."""
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+# ANSI color codes for stdout, empty when it is redirected or NO_COLOR is set
+_COLOR = _use_color()
+RED = '\033[0;31m' if _COLOR else ''
+GREEN = '\033[0;32m' if _COLOR else ''
+YELLOW = '\033[1;33m' if _COLOR else ''
+BLUE = '\033[0;34m' if _COLOR else ''
+CYAN = '\033[0;36m' if _COLOR else ''
+BOLD = '\033[1m' if _COLOR else ''
+DIM = '\033[2m' if _COLOR else ''
+NC = '\033[0m' if _COLOR else ''  # No Color
+
+# log_error and log_warn write to stderr, which may be redirected separately
+_ERR_COLOR = _use_color(sys.stderr)
+_ERR_RED = '\033[0;31m' if _ERR_COLOR else ''
+_ERR_YELLOW = '\033[1;33m' if _ERR_COLOR else ''
+_ERR_NC = '\033[0m' if _ERR_COLOR else ''
 
 
 def log_info(msg: str) -> None:
@@ -37,11 +53,11 @@ def log_info(msg: str) -> None:
 
 
 def log_error(msg: str) -> None:
-    print(f"{RED}[ERROR]{NC} {msg}", file=sys.stderr)
+    print(f"{_ERR_RED}[ERROR]{_ERR_NC} {msg}", file=sys.stderr)
 
 
 def log_warn(msg: str) -> None:
-    print(f"{YELLOW}[WARN]{NC} {msg}", file=sys.stderr)
+    print(f"{_ERR_YELLOW}[WARN]{_ERR_NC} {msg}", file=sys.stderr)
 
 
 def fetch_models(api_base: str, api_key: str) -> Optional[List[Dict[str, Any]]]:
@@ -120,6 +136,18 @@ def truncate(text: str, max_len: int) -> str:
     return text[:max_len - 3] + '...'
 
 
+def _build_search_index(models: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """Pair each model with its lowercased searchable text.
+
+    id, name and description are lowercased in a single call per model;
+    newlines keep a search term from matching across two fields.
+    """
+    return [
+        (m, '\n'.join((m.get('id') or '', m.get('name') or '', m.get('description') or '')).lower())
+        for m in models
+    ]
+
+
 def filter_models(models: List[Dict[str, Any]], args) -> List[Dict[str, Any]]:
     """Apply filters to model list."""
     filtered = models
@@ -139,12 +167,7 @@ def filter_models(models: List[Dict[str, Any]], args) -> List[Dict[str, Any]]:
     # Filter by search term
     if args.search:
         term = args.search.lower()
-        def matches(m):
-            name = (m.get('name') or '').lower()
-            model_id = (m.get('id') or '').lower()
-            desc = (m.get('description') or '').lower()
-            return term in name or term in model_id or term in desc
-        filtered = [m for m in filtered if matches(m)]
+        filtered = [m for m, text in _build_search_index(filtered) if term in text]
 
     # Filter by minimum context
     if args.context_min:
@@ -351,7 +374,8 @@ def cmd_info(args) -> None:
         print_model_info(model)
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description='List and explore available LLM models from OpenRouter',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -392,7 +416,7 @@ Examples:
     info_parser.add_argument('--json', action='store_true',
                              help='Output as JSON')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Default to list if no subcommand
     if not args.command:
@@ -26,10 +26,15 @@ from ab_cli.utils import (
     get_conflicted_files,
 )
 
+# Conflict markers written by git during a merge
+OURS_MARKER = '<<<<<<<'
+SEPARATOR_MARKER = '======='
+THEIRS_MARKER = '>>>>>>>'
+
 
 def has_conflict_markers(content: str) -> bool:
     """Check if content has conflict markers."""
-    return '<<<<<<<' in content and '=======' in content and '>>>>>>>' in content
+    return OURS_MARKER in content and SEPARATOR_MARKER in content and THEIRS_MARKER in content
 
 
 def parse_conflicts(content: str) -> list[dict]:
@@ -39,7 +44,7 @@ def parse_conflicts(content: str) -> list[dict]:
 
     i = 0
     while i < len(lines):
-        if lines[i].startswith('<<<<<<<'):
+        if lines[i].startswith(OURS_MARKER):
             conflict = {
                 'start_line': i + 1,
                 'ours_marker': lines[i],
@@ -51,7 +56,7 @@ def parse_conflicts(content: str) -> list[dict]:
 
             i += 1
             # Collect "ours" version
-            while i < len(lines) and not lines[i].startswith('======='):
+            while i < len(lines) and not lines[i].startswith(SEPARATOR_MARKER):
                 conflict['ours'].append(lines[i])
                 i += 1
 
@@ -59,7 +64,7 @@ def parse_conflicts(content: str) -> list[dict]:
                 i += 1  # Skip =======
 
             # Collect "theirs" version
-            while i < len(lines) and not lines[i].startswith('>>>>>>>'):
+            while i < len(lines) and not lines[i].startswith(THEIRS_MARKER):
                 conflict['theirs'].append(lines[i])
                 i += 1
 
@@ -101,8 +106,8 @@ def resolve_conflict_with_llm(filepath: str, conflict: dict,
     theirs_code = '\n'.join(conflict['theirs'])
 
     # Extract branch names from markers
-    ours_branch = conflict['ours_marker'].replace('<<<<<<<', '').strip() or 'HEAD'
-    theirs_branch = conflict['theirs_marker'].replace('>>>>>>>', '').strip() or 'incoming'
+    ours_branch = conflict['ours_marker'].replace(OURS_MARKER, '').strip() or 'HEAD'
+    theirs_branch = conflict['theirs_marker'].replace(THEIRS_MARKER, '').strip() or 'incoming'
 
     prompt_text = f"""You are a code merging assistant. Resolve this merge conflict by producing the correct merged code.
 
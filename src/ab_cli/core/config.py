@@ -5,7 +5,7 @@ Handles loading, saving, and managing configuration.
 import json
 import os
 import pathlib
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 AB_CONFIG_DIR = pathlib.Path.home() / ".ab"
 AB_CONFIG_FILE = AB_CONFIG_DIR / "config.json"
@@ -63,16 +63,27 @@ class AbConfig:
             cls._instance = super().__new__(cls)
             cls._instance._config = {}
             cls._instance._loaded = False
+            cls._instance._file_stamp = None
         return cls._instance
 
+    @staticmethod
+    def _stat_config_file() -> Optional[Tuple[int, int, int]]:
+        """Return (mtime_ns, size, inode) of the config file, or None if missing."""
+        try:
+            st = os.stat(AB_CONFIG_FILE)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _ensure_loaded(self) -> None:
-        """Ensure configuration is loaded."""
-        if not self._loaded:
+        """Ensure configuration is loaded and matches the file on disk."""
+        if not self._loaded or self._stat_config_file() != self._file_stamp:
             self._load()
 
     def _load(self) -> None:
         """Load configuration from file or use defaults."""
-        if AB_CONFIG_FILE.exists():
+        self._file_stamp = self._stat_config_file()
+        if self._file_stamp is not None:
             try:
                 with open(AB_CONFIG_FILE, 'r', encoding='utf-8') as f:
                     self._config = json.load(f)
@@ -143,6 +154,7 @@ class AbConfig:
         AB_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         with open(AB_CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(self._config, f, indent=2, ensure_ascii=False)
+        self._file_stamp = self._stat_config_file()
 
     def get_with_default(self, path: str) -> Any:
         """Get config value with fallback to DEFAULT_CONFIG."""
@@ -241,6 +253,11 @@ class AbConfig:
         self._ensure_loaded()
         return self._deep_copy(self._config)
 
+    def to_json(self) -> str:
+        """Return full configuration as indented JSON, without copying it first."""
+        self._ensure_loaded()
+        return json.dumps(self._config, indent=2, ensure_ascii=False)
+
     def config_exists(self) -> bool:
         """Check if config file exists."""
         return AB_CONFIG_FILE.exists()
@@ -8,13 +8,15 @@ from typing import List, Optional
 from ab_cli.utils.exceptions import GitError
 
 
-def run_git(*args, capture: bool = True, check: bool = True) -> subprocess.CompletedProcess:
+def run_git(*args, capture: bool = True, check: bool = True,
+            cwd: Optional[str] = None) -> subprocess.CompletedProcess:
     """Run a git command.
 
     Args:
         *args: Git command arguments
         capture: Whether to capture output (default True)
         check: Whether to raise on non-zero exit (default True)
+        cwd: Directory to run git in (default: current directory)
 
     Returns:
         CompletedProcess instance with stdout/stderr
@@ -24,7 +26,8 @@ def run_git(*args, capture: bool = True, check: bool = True) -> subprocess.Compl
         cmd,
         capture_output=capture,
         text=True,
-        check=check
+        check=check,
+        cwd=cwd
     )
 
 
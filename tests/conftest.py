@@ -1,9 +1,13 @@
 """Pytest configuration and fixtures for ab-cli tests."""
+import copy
 import json
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Generator, Mapping, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +15,75 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Don't write .pyc files for modules imported during the test run; the
+# environment variable covers subprocesses spawned by the tests as well.
+sys.dont_write_bytecode = True
+os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+
+# Config for every git process started during the run, by the tests and by
+# the code under test alike: no auto-gc, fsync, fsmonitor or commit signing
+# from the developer's global config, and a predictable initial branch.
+_GIT_TEST_CONFIG = {
+    "gc.auto": "0",
+    "core.fsync": "none",
+    "core.fsyncMethod": "batch",
+    "core.fsmonitor": "false",
+    "commit.gpgsign": "false",
+    "init.defaultBranch": "master",
+}
+if "GIT_CONFIG_COUNT" not in os.environ:
+    os.environ["GIT_CONFIG_COUNT"] = str(len(_GIT_TEST_CONFIG))
+    for index, (key, value) in enumerate(_GIT_TEST_CONFIG.items()):
+        os.environ[f"GIT_CONFIG_KEY_{index}"] = key
+        os.environ[f"GIT_CONFIG_VALUE_{index}"] = value
+os.environ.setdefault("GIT_OPTIONAL_LOCKS", "0")
+os.environ.setdefault("GIT_TERMINAL_PROMPT", "0")
+
+
+# Fixtures that build real git repositories
+_GIT_FIXTURES = {"git_repo_template", "mock_git_repo", "staged_git_repo", "make_conflict"}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that need the git binary when it is not installed.
+
+    A test needs git if it uses one of the repository fixtures or carries
+    the ``git`` marker (for tests that run git outside a repository).
+    """
+    if shutil.which("git") is not None:
+        return
+
+    skip_git = pytest.mark.skip(reason="git not available")
+    for item in items:
+        if _GIT_FIXTURES.intersection(getattr(item, "fixturenames", ())) or item.get_closest_marker("git"):
+            item.add_marker(skip_git)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_file_detection():
+    """Pay binaryornot and pathspec first-use costs once, before any test runs.
+
+    Skipped when either is missing, so tests that never touch them still run.
+    """
+    try:
+        import pathspec
+        from binaryornot.check import is_binary
+    except ImportError:
+        return
+
+    is_binary(__file__)
+    pathspec.GitIgnoreSpec.from_lines(["*.log"])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_config_module():
+    """Import ab_cli.core.config once, before any test runs.
+
+    The singleton itself is still reset per test by reset_config_singleton,
+    so no config is loaded here.
+    """
+    import ab_cli.core.config  # noqa: F401
+
 
 @pytest.fixture(autouse=True)
 def reset_config_singleton():
@@ -29,12 +102,10 @@ def reset_config_singleton():
     config_module.AbConfig._instance = original_instance
 
 
-@pytest.fixture
-def temp_config_dir(tmp_path: Path, monkeypatch) -> Path:
-    """Create temporary config directory and patch config paths."""
+def _patch_config_paths(monkeypatch, config_dir: Path) -> None:
+    """Create config_dir and point the config module constants at it."""
     from ab_cli.core import config as config_module
 
-    config_dir = tmp_path / ".ab"
     config_dir.mkdir(parents=True)
 
     config_file = config_dir / "config.json"
@@ -45,14 +116,16 @@ def temp_config_dir(tmp_path: Path, monkeypatch) -> Path:
     monkeypatch.setattr(config_module, "AB_CONFIG_FILE", config_file)
     monkeypatch.setattr(config_module, "AB_HISTORY_DIR", history_dir)
 
-    return config_dir
 
+_HISTORY_DIR_PLACEHOLDER = "@HISTORY_DIR@"
 
-@pytest.fixture
-def mock_config(temp_config_dir: Path) -> Dict[str, Any]:
-    """Create a mock configuration file."""
-    from ab_cli.core import config as config_module
 
+@pytest.fixture(scope="session")
+def mock_config_template() -> Tuple[Dict[str, Any], str]:
+    """Build the mock configuration and its JSON text once per session.
+
+    The history directory is a placeholder filled in per config directory.
+    """
     config_data = {
         "version": "1.0",
         "global": {
@@ -86,21 +159,171 @@ def mock_config(temp_config_dir: Path) -> Dict[str, Any]:
         },
         "history": {
             "enabled": True,
-            "directory": str(temp_config_dir / "history")
+            "directory": _HISTORY_DIR_PLACEHOLDER
         }
     }
+    return config_data, json.dumps(config_data, indent=2)
+
 
-    config_file = config_module.AB_CONFIG_FILE
-    with open(config_file, "w", encoding="utf-8") as f:
-        json.dump(config_data, f, indent=2)
+def _write_mock_config(config_dir: Path, template: Tuple[Dict[str, Any], str]) -> Dict[str, Any]:
+    """Write the mock configuration file into config_dir."""
+    config_data, config_text = template
+    history_dir = str(config_dir / "history")
+
+    config_file = config_dir / "config.json"
+    config_file.write_text(
+        config_text.replace(_HISTORY_DIR_PLACEHOLDER, json.dumps(history_dir)[1:-1]),
+        encoding="utf-8"
+    )
 
+    config_data = copy.deepcopy(config_data)
+    config_data["history"]["directory"] = history_dir
     return config_data
 
 
+@pytest.fixture(scope="session")
+def config_root(tmp_path_factory) -> Path:
+    """Parent directory reused by every function-scoped config directory."""
+    return tmp_path_factory.mktemp("config_root")
+
+
 @pytest.fixture
-def mock_git_repo(tmp_path: Path) -> Path:
-    """Create a mock git repository."""
-    repo_dir = tmp_path / "test_repo"
+def temp_config_dir(config_root: Path, monkeypatch) -> Path:
+    """Create an empty config directory and patch config paths.
+
+    The same path is wiped and recreated for each test instead of
+    allocating a new tmp_path.
+    """
+    config_dir = config_root / ".ab"
+    shutil.rmtree(config_dir, ignore_errors=True)
+    _patch_config_paths(monkeypatch, config_dir)
+    return config_dir
+
+
+@pytest.fixture
+def mock_config(temp_config_dir: Path, mock_config_template) -> Dict[str, Any]:
+    """Create a mock configuration file."""
+    return _write_mock_config(temp_config_dir, mock_config_template)
+
+
+@pytest.fixture
+def read_config_file():
+    """Return a helper that parses the config file as currently on disk."""
+    from ab_cli.core import config as config_module
+
+    def _read_config_file() -> Dict[str, Any]:
+        return json.loads(config_module.AB_CONFIG_FILE.read_text(encoding="utf-8"))
+
+    return _read_config_file
+
+
+@pytest.fixture(scope="class")
+def shared_mock_config(tmp_path_factory, mock_config_template) -> Generator[Dict[str, Any], None, None]:
+    """Class-scoped mock configuration for tests that only read it.
+
+    Tests that modify the configuration must use mock_config instead.
+    """
+    config_dir = tmp_path_factory.mktemp("config") / ".ab"
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_config_paths(mp, config_dir)
+        yield _write_mock_config(config_dir, mock_config_template)
+
+
+@pytest.fixture(scope="session")
+def large_text_file(tmp_path_factory) -> Path:
+    """Create a 1MB ASCII text file once per test session (read-only)."""
+    large_file = tmp_path_factory.mktemp("large") / "large.txt"
+    large_file.write_bytes(b"x" * 1_000_000)
+    return large_file
+
+
+# Sample OpenRouter /models entries for the ab models tests
+_SAMPLE_MODELS = (
+    {
+        "id": "openai/gpt-4o",
+        "name": "GPT-4o",
+        "description": "OpenAI's most advanced multimodal model",
+        "context_length": 128000,
+        "pricing": {"prompt": "0.0000025", "completion": "0.00001"},
+        "architecture": {
+            "input_modalities": ["text", "image"],
+            "output_modalities": ["text"],
+        },
+        "top_provider": {"max_completion_tokens": 16384},
+        "supported_parameters": ["temperature", "top_p", "max_tokens"],
+    },
+    {
+        "id": "anthropic/claude-3-haiku",
+        "name": "Claude 3 Haiku",
+        "description": "Fast and efficient Claude model",
+        "context_length": 200000,
+        "pricing": {"prompt": "0.00000025", "completion": "0.00000125"},
+        "architecture": {
+            "input_modalities": ["text", "image"],
+            "output_modalities": ["text"],
+        },
+        "top_provider": {"max_completion_tokens": 4096},
+        "supported_parameters": ["temperature", "top_p"],
+    },
+    {
+        "id": "meta-llama/llama-3-8b:free",
+        "name": "Llama 3 8B",
+        "description": "Free Llama model",
+        "context_length": 8192,
+        "pricing": {"prompt": "0", "completion": "0"},
+        "architecture": {
+            "input_modalities": ["text"],
+            "output_modalities": ["text"],
+        },
+        "top_provider": {"max_completion_tokens": 2048},
+        "supported_parameters": ["temperature"],
+    },
+    {
+        "id": "google/gemini-pro-vision",
+        "name": "Gemini Pro Vision",
+        "description": "Google's vision model",
+        "context_length": 32000,
+        "pricing": {"prompt": "0.00000025", "completion": "0.0000005"},
+        "architecture": {
+            "input_modalities": ["text", "image", "video"],
+            "output_modalities": ["text"],
+        },
+        "top_provider": {"max_completion_tokens": 8192},
+        "supported_parameters": ["temperature", "top_p"],
+    },
+)
+
+
+@pytest.fixture(scope="session")
+def sample_models() -> Tuple[Mapping[str, Any], ...]:
+    """Sample model entries, shared read-only across the session.
+
+    Pass [dict(m) for m in sample_models] wherever the code under test
+    needs real dicts, e.g. to serialize them as JSON.
+    """
+    return tuple(MappingProxyType(model) for model in _SAMPLE_MODELS)
+
+
+@pytest.fixture(scope="session")
+def models_module():
+    """ab_cli.commands.models, imported once for the session."""
+    from ab_cli.commands import models
+
+    return models
+
+
+@pytest.fixture
+def mock_fetch(models_module, monkeypatch, sample_models) -> MagicMock:
+    """Replace ab_cli.commands.models.fetch_models; it returns the sample models."""
+    mock = MagicMock(return_value=[dict(m) for m in sample_models])
+    monkeypatch.setattr(models_module, "fetch_models", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory) -> Path:
+    """Create a template git repository once per test session."""
+    repo_dir = tmp_path_factory.mktemp("git_template") / "test_repo"
     repo_dir.mkdir()
 
     # Initialize git repo
@@ -142,9 +365,109 @@ def mock_git_repo(tmp_path: Path) -> Path:
         check=True
     )
 
+    # Commit-graph lookups; the file lives under .git/objects so every copy shares it
+    subprocess.run(
+        ["git", "commit-graph", "write", "--reachable", "--changed-paths", "--no-progress"],
+        cwd=repo_dir,
+        capture_output=True,
+        check=True
+    )
+
+    return repo_dir
+
+
+def _link_git_object(src: str, dst: str) -> None:
+    """Hard-link immutable git objects, copy every other file."""
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+@pytest.fixture
+def mock_git_repo(tmp_path: Path, git_repo_template: Path) -> Path:
+    """Create a mock git repository.
+
+    Copies the session template instead of re-initializing it. Object
+    files are hard-linked since git never modifies them in place.
+
+    The copied .git/index still holds the template's stat data (inode,
+    ctime), so git sees every tracked file as possibly changed. Porcelain
+    commands re-hash those files and report them clean; plumbing such as
+    ``git diff-files`` does not refresh and needs
+    ``git update-index -q --refresh`` first.
+    """
+    repo_dir = tmp_path / "test_repo"
+    shutil.copytree(git_repo_template, repo_dir, copy_function=_link_git_object)
+    return repo_dir
+
+
+@pytest.fixture(scope="session")
+def staged_git_repo_template(tmp_path_factory, git_repo_template: Path) -> Path:
+    """Template repository with test.txt and other.txt staged, built once."""
+    repo_dir = tmp_path_factory.mktemp("staged_template") / "test_repo"
+    shutil.copytree(git_repo_template, repo_dir, copy_function=_link_git_object)
+
+    for name in ("test.txt", "other.txt"):
+        (repo_dir / name).write_text("test content")
+    subprocess.run(
+        ["git", "add", "-A"],
+        cwd=repo_dir,
+        capture_output=True,
+        check=True
+    )
+
+    return repo_dir
+
+
+@pytest.fixture
+def staged_git_repo(tmp_path: Path, staged_git_repo_template: Path) -> Path:
+    """Create a git repository with uncommitted staged files.
+
+    Copies the staged session template, so the test itself starts no git
+    process to prepare the index.
+    """
+    repo_dir = tmp_path / "test_repo"
+    shutil.copytree(staged_git_repo_template, repo_dir, copy_function=_link_git_object)
     return repo_dir
 
 
+_MAKE_CONFLICT_SCRIPT = """
+set -e
+git checkout -q -b feature
+echo 'feature content' > "$1"
+git add "$1"
+git commit -q -m 'feature change'
+git checkout -q master
+echo 'master content' > "$1"
+git add "$1"
+git commit -q -m 'master change'
+git merge -q feature || true
+"""
+
+
+@pytest.fixture
+def make_conflict():
+    """Return a helper that leaves a repository mid-merge with a conflict.
+
+    The helper commits diverging versions of ``filename`` on ``feature``
+    and ``master`` and then merges ``feature`` into ``master``. All steps
+    run in a single shell so the setup costs one subprocess.
+    """
+    def _make_conflict(repo_dir: Path, filename: str = "test.txt") -> None:
+        subprocess.run(
+            ["sh", "-c", _MAKE_CONFLICT_SCRIPT, "make_conflict", filename],
+            cwd=repo_dir,
+            capture_output=True,
+            check=True
+        )
+
+    return _make_conflict
+
+
 @pytest.fixture
 def mock_subprocess():
     """Mock subprocess.run for git commands."""
@@ -29,6 +29,7 @@ class TestGitRepoDetection:
         monkeypatch.chdir(mock_git_repo)
         assert is_git_repo() is True
 
+    @pytest.mark.git
     def test_is_git_repo_false(self, tmp_path, monkeypatch):
         """Returns False outside git repository."""
         monkeypatch.chdir(tmp_path)
@@ -200,6 +201,7 @@ class TestRepoRoot:
 class TestMain:
     """Tests for main() entry point."""
 
+    @pytest.mark.git
     def test_main_not_git_repo_exits_1(self, tmp_path, monkeypatch, capsys):
         """Exits with error when not in git repository."""
         monkeypatch.chdir(tmp_path)
@@ -224,7 +226,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert "No changes to commit" in captured.out
 
-    def test_main_prompt_not_found_exits_1(self, mock_git_repo, monkeypatch, capsys):
+    def test_main_prompt_not_found_exits_1(self, mock_git_repo, monkeypatch):
         """Exits with error if API call fails."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -277,7 +279,7 @@ class TestMain:
         # Verify staging was called (the flag was honored)
         assert call_count[0] >= 1
 
-    def test_main_user_cancels(self, mock_git_repo, monkeypatch, capsys):
+    def test_main_user_cancels(self, mock_git_repo, monkeypatch):
         """Handles user cancellation during staging prompt."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -48,6 +48,7 @@ class TestIsGitRepo:
         monkeypatch.chdir(mock_git_repo)
         assert is_git_repo() is True
 
+    @pytest.mark.git
     def test_is_git_repo_false(self, tmp_path, monkeypatch):
         """Returns False outside git repository."""
         monkeypatch.chdir(tmp_path)
@@ -99,7 +100,7 @@ class TestCreateBranch:
         current = get_current_branch()
         assert current == 'feature/new-feature'
 
-    def test_create_branch_already_exists_fails(self, mock_git_repo, monkeypatch, capsys):
+    def test_create_branch_already_exists_fails(self, mock_git_repo, monkeypatch):
         """Returns False when branch already exists."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -151,6 +152,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert 'usage:' in captured.out.lower() or 'description' in captured.out.lower()
 
+    @pytest.mark.git
     def test_main_create_not_git_repo_exits_1(self, tmp_path, monkeypatch, capsys):
         """Exits with error when --create used outside git repo."""
         monkeypatch.chdir(tmp_path)
@@ -163,7 +165,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert 'not a git repository' in captured.err.lower()
 
-    def test_main_prefix_flag_accepted(self, monkeypatch, capsys, mock_config):
+    def test_main_prefix_flag_accepted(self, monkeypatch, mock_config):
         """Accepts --prefix flag."""
         monkeypatch.setattr(sys, 'argv', ['branch-name', '--prefix', 'fix', 'test description'])
 
@@ -177,7 +179,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_lang_flag_accepted(self, monkeypatch, capsys, mock_config):
+    def test_main_lang_flag_accepted(self, monkeypatch, mock_config):
         """Accepts --lang flag."""
         monkeypatch.setattr(sys, 'argv', ['branch-name', '-l', 'pt-br', 'test description'])
 
@@ -206,7 +208,7 @@ class TestMain:
             captured = capsys.readouterr()
             assert 'feature/add-user-auth' in captured.out
 
-    def test_main_create_branch_with_confirmation(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_create_branch_with_confirmation(self, mock_git_repo, monkeypatch, mock_config):
         """Creates branch with user confirmation."""
         monkeypatch.chdir(mock_git_repo)
         monkeypatch.setattr(sys, 'argv', ['branch-name', '-c', '-y', 'add feature'])
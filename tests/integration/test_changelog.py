@@ -27,6 +27,7 @@ class TestIsGitRepo:
         monkeypatch.chdir(mock_git_repo)
         assert is_git_repo() is True
 
+    @pytest.mark.git
     def test_is_git_repo_false(self, tmp_path, monkeypatch):
         """Returns False outside git repository."""
         monkeypatch.chdir(tmp_path)
@@ -209,6 +210,7 @@ class TestCategorizeCommits:
 class TestMain:
     """Tests for main() entry point."""
 
+    @pytest.mark.git
     def test_main_not_git_repo_exits_1(self, tmp_path, monkeypatch, capsys):
         """Exits with error when not in git repo."""
         monkeypatch.chdir(tmp_path)
@@ -237,7 +239,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert 'no commits' in captured.out.lower()
 
-    def test_main_format_flag_accepted(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_format_flag_accepted(self, mock_git_repo, monkeypatch, mock_config):
         """Accepts --format flag."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -258,7 +260,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_output_flag_accepted(self, mock_git_repo, monkeypatch, capsys, mock_config, tmp_path):
+    def test_main_output_flag_accepted(self, mock_git_repo, monkeypatch, mock_config, tmp_path):
         """Accepts --output flag."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -280,7 +282,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_categories_flag_accepted(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_categories_flag_accepted(self, mock_git_repo, monkeypatch, mock_config):
         """Accepts --categories flag."""
         monkeypatch.chdir(mock_git_repo)
 
@@ -301,7 +303,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_generates_changelog(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_generates_changelog(self, mock_git_repo, monkeypatch, mock_config):
         """Generates and displays changelog."""
         monkeypatch.chdir(mock_git_repo)
 
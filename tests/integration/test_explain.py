@@ -265,7 +265,7 @@ class TestMain:
             captured = capsys.readouterr()
             assert 'no explanation' in captured.out.lower() or 'warning' in captured.out.lower()
 
-    def test_main_concept_flag(self, monkeypatch, capsys, mock_config):
+    def test_main_concept_flag(self, monkeypatch, mock_config):
         """Accepts --concept flag."""
         monkeypatch.setattr(sys, 'argv', ['explain', '--concept', 'dependency injection'])
 
@@ -279,7 +279,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_history_flag(self, tmp_path, monkeypatch, capsys, mock_config):
+    def test_main_history_flag(self, tmp_path, monkeypatch, mock_config):
         """Accepts --history flag."""
         histfile = tmp_path / '.bash_history'
         histfile.write_text('echo test\n')
@@ -297,7 +297,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_with_files_flag(self, monkeypatch, capsys, mock_config):
+    def test_main_with_files_flag(self, monkeypatch, mock_config):
         """Accepts --with-files flag."""
         monkeypatch.setattr(sys, 'argv', ['explain', '--with-files', 'some error'])
 
@@ -311,7 +311,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_verbose_flag(self, monkeypatch, capsys, mock_config):
+    def test_main_verbose_flag(self, monkeypatch, mock_config):
         """Accepts --verbose flag."""
         monkeypatch.setattr(sys, 'argv', ['explain', '-v', 'some concept'])
 
@@ -325,7 +325,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_file_input(self, tmp_path, monkeypatch, capsys, mock_config):
+    def test_main_file_input(self, tmp_path, monkeypatch, mock_config):
         """Handles file input."""
         test_file = tmp_path / 'test.py'
         test_file.write_text('def hello(): pass\n')
@@ -344,7 +344,7 @@ class TestMain:
             # Verify call_llm_with_model_info was called
             assert mock_call.called
 
-    def test_main_stdin_input(self, monkeypatch, capsys, mock_config):
+    def test_main_stdin_input(self, monkeypatch, mock_config):
         """Handles stdin input with '-'."""
         monkeypatch.setattr(sys, 'argv', ['explain', '-'])
 
@@ -218,7 +218,7 @@ class TestMain:
             captured = capsys.readouterr()
             assert 'failed' in captured.err.lower()
 
-    def test_main_lang_flag_accepted(self, monkeypatch, capsys, mock_config):
+    def test_main_lang_flag_accepted(self, monkeypatch, mock_config):
         """Accepts --lang flag."""
         monkeypatch.setattr(sys, 'argv', ['gen-script', '--lang', 'python', 'test'])
 
@@ -232,7 +232,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_type_flag_accepted(self, monkeypatch, capsys, mock_config):
+    def test_main_type_flag_accepted(self, monkeypatch, mock_config):
         """Accepts --type flag."""
         monkeypatch.setattr(sys, 'argv', ['gen-script', '--type', 'cron', 'test'])
 
@@ -246,7 +246,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_full_flag_accepted(self, monkeypatch, capsys, mock_config):
+    def test_main_full_flag_accepted(self, monkeypatch, mock_config):
         """Accepts --full flag."""
         monkeypatch.setattr(sys, 'argv', ['gen-script', '--full', 'test'])
 
@@ -260,7 +260,7 @@ class TestMain:
 
         # If we got here without argument error, the flag was accepted
 
-    def test_main_output_flag_creates_file(self, tmp_path, monkeypatch, capsys, mock_config):
+    def test_main_output_flag_creates_file(self, tmp_path, monkeypatch, mock_config):
         """--output flag creates executable file."""
         output_file = tmp_path / 'test_script.sh'
         monkeypatch.setattr(sys, 'argv', ['gen-script', '-o', str(output_file), 'test'])
@@ -277,7 +277,7 @@ class TestMain:
         if output_file.exists():
             assert os.access(output_file, os.X_OK)
 
-    def test_main_generates_script_with_context(self, monkeypatch, capsys, mock_config):
+    def test_main_generates_script_with_context(self, monkeypatch, mock_config):
         """Generates script with system context."""
         monkeypatch.setattr(sys, 'argv', ['gen-script', 'list files'])
 
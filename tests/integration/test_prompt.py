@@ -1,6 +1,28 @@
 """Integration tests for ab_cli.commands.prompt module."""
+import functools
 import json
 import os
+import sys
+from io import StringIO
+from typing import Tuple
+from unittest.mock import patch
+
+import pytest
+
+# Skip the whole module at collection if the file-handling deps are missing
+pathspec = pytest.importorskip("pathspec")
+is_binary = pytest.importorskip("binaryornot.check").is_binary
+
+from ab_cli.commands import prompt as prompt_module  # noqa: E402
+from ab_cli.core.config import estimate_tokens, get_config  # noqa: E402
+
+TOKEN_TEST_TEXT = "a" * 400
+
+
+@functools.lru_cache(maxsize=64)
+def _make_spec(patterns: Tuple[str, ...]) -> pathspec.PathSpec:
+    """Compile a gitwildmatch spec once per distinct pattern set."""
+    return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
 
 
 class TestLoadConfig:
@@ -8,8 +30,6 @@ class TestLoadConfig:
 
     def test_load_config_uses_defaults(self, temp_config_dir):
         """Uses default configuration when no file exists."""
-        from ab_cli.core.config import get_config
-
         config = get_config()
         assert config.get_with_default("global.api_base") == "https://openrouter.ai/api/v1"
 
@@ -19,40 +39,23 @@ class TestPersistDefaultModel:
 
     def test_persist_default_model(self, temp_config_dir):
         """Saves default model to config."""
-        from ab_cli.core.config import get_config
-
         config = get_config()
         config.init_config()
         config.set("models.default", "new/model")
 
         # Verify persisted
-        config.reload()
-        assert config.get("models.default") == "new/model"
+        saved = json.loads(config.get_config_path().read_text())
+        assert saved["models"]["default"] == "new/model"
 
 
 class TestApiCalls:
     """Tests for API call functionality."""
 
-    def test_send_to_openrouter_success(self, mock_requests, mock_env, temp_config_dir):
-        """API call succeeds with valid response."""
-        # Import after patching
-        response = mock_requests.return_value
-        response.status_code = 200
-        response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}],
-            "usage": {"prompt_tokens": 100, "completion_tokens": 50}
-        }
-
-        # Verify mock is set up
-        assert response.status_code == 200
-
     def test_send_to_openrouter_no_api_key(self, temp_config_dir, monkeypatch):
         """Returns error without API key."""
         # Ensure no API key is set
         monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
 
-        from ab_cli.core.config import get_config
-
         config = get_config()
         api_settings = config.get_api_settings()
 
@@ -70,8 +73,6 @@ class TestBinaryFileDetection:
         binary_file = tmp_path / "test.bin"
         binary_file.write_bytes(bytes([0x00, 0x01, 0x02, 0x89, 0x50, 0x4E, 0x47]))
 
-        from binaryornot.check import is_binary
-
         assert is_binary(str(binary_file)) is True
 
     def test_is_binary_file_false(self, tmp_path):
@@ -79,8 +80,6 @@ class TestBinaryFileDetection:
         text_file = tmp_path / "test.txt"
         text_file.write_text("This is a text file\nwith multiple lines")
 
-        from binaryornot.check import is_binary
-
         assert is_binary(str(text_file)) is False
 
 
@@ -89,14 +88,12 @@ class TestAiignore:
 
     def test_should_ignore_path_matches_pattern(self, tmp_path):
         """Respects .aiignore patterns."""
-        import pathspec
-
         # Create .aiignore
         aiignore = tmp_path / ".aiignore"
         aiignore.write_text("*.log\nnode_modules/\n__pycache__/\n")
 
-        patterns = aiignore.read_text().strip().split("\n")
-        spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        patterns = tuple(aiignore.read_text().strip().split("\n"))
+        spec = _make_spec(patterns)
 
         assert spec.match_file("test.log") is True
         assert spec.match_file("node_modules/package.json") is True
@@ -105,10 +102,7 @@ class TestAiignore:
 
     def test_should_ignore_negation_pattern(self, tmp_path):
         """Handles negation patterns."""
-        import pathspec
-
-        patterns = ["*.log", "!important.log"]
-        spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        spec = _make_spec(("*.log", "!important.log"))
 
         assert spec.match_file("debug.log") is True
         # Note: pathspec handles negation differently
@@ -120,64 +114,49 @@ class TestFileProcessing:
 
     def test_process_file_reads_content(self, tmp_path):
         """Reads and formats file content."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text("def hello():\n    print('Hello')\n")
+        test_file = tmp_path / "hello.py"
+        test_file.write_text("def hello():\n    print('Hello')\n", encoding="utf-8")
+
+        content, words, tokens = prompt_module.process_file(test_file, "name_only", 1000)
 
-        content = test_file.read_text()
-        assert "def hello():" in content
-        assert "print('Hello')" in content
+        assert content == "// filename=\"hello.py\"\ndef hello():\n    print('Hello')\n\n"
+        assert words == 3
+        assert tokens == len("def hello():\n    print('Hello')\n") // 4
 
     def test_process_file_handles_encoding(self, tmp_path):
         """Handles different file encodings."""
         test_file = tmp_path / "unicode.txt"
-        test_file.write_text("Olá mundo! 你好世界! 🎉", encoding="utf-8")
+        test_file.write_bytes("Olá mundo! 你好世界! 🎉".encode("utf-8"))
+
+        content, _, _ = prompt_module.process_file(test_file, "name_only", 1000)
 
-        content = test_file.read_text(encoding="utf-8")
         assert "Olá" in content
         assert "你好" in content
 
-    def test_process_file_truncation(self, tmp_path):
+    def test_process_file_truncation(self, large_text_file):
         """Truncates large files."""
-        # Create a large file
-        large_file = tmp_path / "large.txt"
-        large_content = "x" * 1000000  # 1MB
-        large_file.write_text(large_content)
-
-        # Simulate truncation logic
-        max_chars = 100000
-        content = large_file.read_text()[:max_chars]
+        content, _, tokens = prompt_module.process_file(large_text_file, "name_only", 25000)
 
-        assert len(content) == max_chars
+        assert 'warning_content_truncated="true"' in content
+        assert 'original_token_count="250000"' in content
+        assert tokens == 25000
+        assert content.endswith('new_token_count="25000"\n' + "x" * 100000 + "\n")
 
 
 class TestSpecialistPersonas:
     """Tests for specialist persona handling."""
 
-    def test_build_specialist_prefix_dev(self):
-        """Returns dev persona prefix."""
-        # Test the concept of specialist prefixes
-        specialists = {
-            "dev": "You are an expert software developer",
-            "rm": "You are an expert release manager"
-        }
-        assert "developer" in specialists["dev"].lower()
-
-    def test_build_specialist_prefix_rm(self):
-        """Returns RM persona prefix."""
-        specialists = {
-            "dev": "You are an expert software developer",
-            "rm": "You are an expert release manager"
-        }
-        assert "release manager" in specialists["rm"].lower()
-
-    def test_build_specialist_prefix_none(self):
-        """Returns empty for unknown specialist."""
-        specialists = {
-            "dev": "Developer",
-            "rm": "Release Manager"
-        }
-        result = specialists.get("unknown", "")
-        assert result == ""
+    @pytest.mark.parametrize("specialist, fragment", [
+        ("dev", "senior programmer"),
+        ("rm", "retail media analyst"),
+        ("unknown", ""),
+        (None, ""),
+    ])
+    def test_build_specialist_prefix(self, specialist, fragment):
+        """Returns the persona prefix, or empty for unknown specialists."""
+        result = prompt_module.build_specialist_prefix(specialist)
+        assert fragment in result.lower()
+        assert bool(result) == bool(fragment)
 
 
 class TestTokenEstimation:
@@ -185,17 +164,12 @@ class TestTokenEstimation:
 
     def test_estimate_tokens_accuracy(self):
         """Token estimation is reasonably accurate."""
-        from ab_cli.core.config import estimate_tokens
-
         # ~4 chars per token is the approximation
-        text = "a" * 400
-        tokens = estimate_tokens(text)
+        tokens = estimate_tokens(TOKEN_TEST_TEXT)
         assert tokens == 100
 
     def test_estimate_tokens_with_code(self):
         """Estimates tokens in code correctly."""
-        from ab_cli.core.config import estimate_tokens
-
         code = """
 def hello_world():
     print("Hello, World!")
@@ -212,20 +186,20 @@ if __name__ == "__main__":
 class TestModelSelection:
     """Tests for automatic model selection."""
 
-    def test_select_model_by_tokens(self, mock_config):
-        """Selects model based on token count."""
-        from ab_cli.core.config import get_config
-
-        config = get_config()
-
+    @pytest.mark.parametrize("tokens, expected", [
         # Small model for small context
-        assert config.select_model(50000) == "test/model-small"
-
+        (50000, "test/model-small"),
+        (128000, "test/model-small"),
         # Medium model for medium context
-        assert config.select_model(200000) == "test/model-medium"
-
+        (128001, "test/model-medium"),
+        (200000, "test/model-medium"),
+        (256000, "test/model-medium"),
         # Large model for large context
-        assert config.select_model(300000) == "test/model-large"
+        (300000, "test/model-large"),
+    ])
+    def test_select_model_by_tokens(self, mock_config, tokens, expected):
+        """Selects model based on token count."""
+        assert get_config().select_model(tokens) == expected
 
 
 class TestHistoryTracking:
@@ -233,8 +207,6 @@ class TestHistoryTracking:
 
     def test_history_directory_exists(self, temp_config_dir):
         """History directory can be created."""
-        from ab_cli.core.config import get_config
-
         config = get_config()
         history_dir = config.get_history_dir()
 
@@ -243,8 +215,6 @@ class TestHistoryTracking:
 
     def test_history_enabled_by_default(self, mock_config):
         """History is enabled by default."""
-        from ab_cli.core.config import get_config
-
         config = get_config()
         assert config.is_history_enabled() is True
 
@@ -252,24 +222,23 @@ class TestHistoryTracking:
 class TestInputHandling:
     """Tests for various input handling scenarios."""
 
-    def test_stdin_prompt_reading(self):
-        """Can read prompt from stdin."""
-        from io import StringIO
+    def test_stdin_prompt_reading(self, tmp_path, monkeypatch, temp_config_dir):
+        """Reads the prompt from stdin when '-p -' is given."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(prompt_module, "VERBOSE", True)
+        monkeypatch.setattr(sys, "stdin", StringIO("What is Python?"))
+        monkeypatch.setattr(sys, "argv", ["prompt", "-p", "-", "--only-output"])
 
-        stdin_content = "What is Python?"
-        mock_stdin = StringIO(stdin_content)
+        with patch.object(prompt_module, "send_to_openrouter", return_value=None) as mock_send:
+            with pytest.raises(SystemExit):
+                prompt_module.main()
 
-        content = mock_stdin.read()
-        assert content == "What is Python?"
+        assert mock_send.call_args[0][0] == "What is Python?"
 
     def test_file_path_handling(self, tmp_path):
         """Handles file paths correctly."""
-        # Create nested directory structure
-        src_dir = tmp_path / "src" / "components"
-        src_dir.mkdir(parents=True)
-
-        test_file = src_dir / "Button.tsx"
-        test_file.write_text("export const Button = () => <button>Click</button>")
+        test_file = tmp_path / "Button.tsx"
+        test_file.touch()
 
         # Verify path handling
         assert test_file.exists()
@@ -283,10 +252,7 @@ class TestOutputFormatting:
     def test_json_output_parsing(self):
         """Parses JSON output correctly."""
         json_response = '{"key": "value", "number": 42}'
-        parsed = json.loads(json_response)
-
-        assert parsed["key"] == "value"
-        assert parsed["number"] == 42
+        assert json.loads(json_response) == {"key": "value", "number": 42}
 
     def test_relative_paths_display(self, tmp_path, monkeypatch):
         """Displays relative paths correctly."""
@@ -6,6 +6,9 @@ from unittest.mock import patch
 import pytest
 
 from ab_cli.commands.resolve_conflict import (
+    OURS_MARKER,
+    SEPARATOR_MARKER,
+    THEIRS_MARKER,
     apply_resolution,
     get_conflicted_files,
     get_file_context,
@@ -14,105 +17,32 @@ from ab_cli.commands.resolve_conflict import (
     main,
     parse_conflicts,
 )
+from ab_cli.utils import git_helpers
 
-
-class TestIsGitRepo:
-    """Tests for is_git_repo function."""
-
-    def test_is_git_repo_true(self, mock_git_repo, monkeypatch):
-        """Returns True inside git repository."""
-        monkeypatch.chdir(mock_git_repo)
-        assert is_git_repo() is True
-
-    def test_is_git_repo_false(self, tmp_path, monkeypatch):
-        """Returns False outside git repository."""
-        monkeypatch.chdir(tmp_path)
-        assert is_git_repo() is False
-
-
-class TestGetConflictedFiles:
-    """Tests for get_conflicted_files function."""
-
-    def test_get_conflicted_files_none(self, mock_git_repo, monkeypatch):
-        """Returns empty list when no conflicts."""
-        monkeypatch.chdir(mock_git_repo)
-        result = get_conflicted_files()
-        assert result == []
-
-    def test_get_conflicted_files_with_conflict(self, mock_git_repo, monkeypatch):
-        """Returns list of conflicted files."""
-        monkeypatch.chdir(mock_git_repo)
-
-        # Create a conflict scenario
-        # Create a branch and modify a file
-        subprocess.run(['git', 'checkout', '-b', 'feature'], cwd=mock_git_repo, check=True)
-        (mock_git_repo / 'test.txt').write_text('feature content\n')
-        subprocess.run(['git', 'add', '.'], cwd=mock_git_repo, check=True)
-        subprocess.run(['git', 'commit', '-m', 'feature change'], cwd=mock_git_repo, check=True)
-
-        # Go back to master and make conflicting change
-        subprocess.run(['git', 'checkout', 'master'], cwd=mock_git_repo, check=True)
-        (mock_git_repo / 'test.txt').write_text('master content\n')
-        subprocess.run(['git', 'add', '.'], cwd=mock_git_repo, check=True)
-        subprocess.run(['git', 'commit', '-m', 'master change'], cwd=mock_git_repo, check=True)
-
-        # Try to merge (will conflict)
-        subprocess.run(['git', 'merge', 'feature'], cwd=mock_git_repo, check=False)
-
-        result = get_conflicted_files()
-        assert 'test.txt' in result
-
-
-class TestHasConflictMarkers:
-    """Tests for has_conflict_markers function."""
-
-    def test_has_conflict_markers_true(self):
-        """Returns True when conflict markers present."""
-        content = '''some code
+CONFLICT_FULL = '''some code
 <<<<<<< HEAD
 master version
 =======
 feature version
 >>>>>>> feature
 more code'''
-        assert has_conflict_markers(content) is True
 
-    def test_has_conflict_markers_false(self):
-        """Returns False when no conflict markers."""
-        content = '''normal code
+NO_MARKERS = '''normal code
 without any conflict markers
 just regular content'''
-        assert has_conflict_markers(content) is False
 
-    def test_has_conflict_markers_partial(self):
-        """Returns False when only partial markers."""
-        # Only has <<<<<<< but not ======= and >>>>>>>
-        content = '''<<<<<<< HEAD
+PARTIAL_MARKERS = '''<<<<<<< HEAD
 some content'''
-        assert has_conflict_markers(content) is False
 
-
-class TestParseConflicts:
-    """Tests for parse_conflicts function."""
-
-    def test_parse_conflicts_single(self):
-        """Parses single conflict correctly."""
-        content = '''line1
+SINGLE_CONFLICT = '''line1
 <<<<<<< HEAD
 master version
 =======
 feature version
 >>>>>>> feature
 line2'''
-        conflicts = parse_conflicts(content)
-
-        assert len(conflicts) == 1
-        assert conflicts[0]['ours'] == ['master version']
-        assert conflicts[0]['theirs'] == ['feature version']
 
-    def test_parse_conflicts_multiple(self):
-        """Parses multiple conflicts correctly."""
-        content = '''line1
+MULTIPLE_CONFLICTS = '''line1
 <<<<<<< HEAD
 master 1
 =======
@@ -125,15 +55,8 @@ master 2
 feature 2
 >>>>>>> feature
 line3'''
-        conflicts = parse_conflicts(content)
-
-        assert len(conflicts) == 2
-        assert conflicts[0]['ours'] == ['master 1']
-        assert conflicts[1]['ours'] == ['master 2']
 
-    def test_parse_conflicts_multiline(self):
-        """Parses multi-line conflict sections."""
-        content = '''<<<<<<< HEAD
+MULTILINE_CONFLICT = '''<<<<<<< HEAD
 line1
 line2
 line3
@@ -141,17 +64,84 @@ line3
 alt1
 alt2
 >>>>>>> feature'''
-        conflicts = parse_conflicts(content)
 
-        assert len(conflicts) == 1
-        assert conflicts[0]['ours'] == ['line1', 'line2', 'line3']
-        assert conflicts[0]['theirs'] == ['alt1', 'alt2']
+BARE_CONFLICT = '''<<<<<<< HEAD
+master
+=======
+feature
+>>>>>>> feature
+'''
+
+EMBEDDED_CONFLICT = 'line1\n' + BARE_CONFLICT + 'line2\n'
+
 
-    def test_parse_conflicts_empty(self):
-        """Returns empty list for no conflicts."""
-        content = 'normal content without conflicts'
+class TestIsGitRepo:
+    """Tests for is_git_repo function."""
+
+    def test_is_git_repo_true(self, monkeypatch):
+        """Returns True inside git repository."""
+        monkeypatch.setattr(
+            git_helpers.subprocess, 'run',
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout='true\n', stderr='')
+        )
+        assert is_git_repo() is True
+
+    def test_is_git_repo_false(self, monkeypatch):
+        """Returns False outside git repository."""
+        def fake_run(cmd, **kwargs):
+            raise subprocess.CalledProcessError(128, cmd)
+
+        monkeypatch.setattr(git_helpers.subprocess, 'run', fake_run)
+        assert is_git_repo() is False
+
+
+class TestGetConflictedFiles:
+    """Tests for get_conflicted_files function."""
+
+    def test_get_conflicted_files_none(self, mock_git_repo, monkeypatch):
+        """Returns empty list when no conflicts."""
+        monkeypatch.chdir(mock_git_repo)
+        result = get_conflicted_files()
+        assert result == []
+
+    def test_get_conflicted_files_with_conflict(self, mock_git_repo, monkeypatch, make_conflict):
+        """Returns list of conflicted files."""
+        monkeypatch.chdir(mock_git_repo)
+        make_conflict(mock_git_repo, 'test.txt')
+
+        result = get_conflicted_files()
+        assert 'test.txt' in result
+
+
+class TestHasConflictMarkers:
+    """Tests for has_conflict_markers function."""
+
+    @pytest.mark.parametrize("content, expected", [
+        (CONFLICT_FULL, True),
+        (NO_MARKERS, False),
+        # Only has <<<<<<< but not ======= and >>>>>>>
+        (PARTIAL_MARKERS, False),
+        # Markers are detected anywhere in the content, not only at line start
+        (f'{OURS_MARKER} {SEPARATOR_MARKER} {THEIRS_MARKER}', True),
+    ], ids=["full", "none", "partial", "inline"])
+    def test_has_conflict_markers(self, content, expected):
+        """Detects conflict markers only when all three are present."""
+        assert has_conflict_markers(content) is expected
+
+
+class TestParseConflicts:
+    """Tests for parse_conflicts function."""
+
+    @pytest.mark.parametrize("content, expected", [
+        (SINGLE_CONFLICT, [(['master version'], ['feature version'])]),
+        (MULTIPLE_CONFLICTS, [(['master 1'], ['feature 1']), (['master 2'], ['feature 2'])]),
+        (MULTILINE_CONFLICT, [(['line1', 'line2', 'line3'], ['alt1', 'alt2'])]),
+        ('normal content without conflicts', []),
+    ], ids=["single", "multiple", "multiline", "empty"])
+    def test_parse_conflicts(self, content, expected):
+        """Parses ours/theirs sections of each conflict."""
         conflicts = parse_conflicts(content)
-        assert conflicts == []
+        assert [(c['ours'], c['theirs']) for c in conflicts] == expected
 
 
 class TestGetFileContext:
@@ -189,14 +179,7 @@ class TestApplyResolution:
     def test_apply_resolution_success(self, tmp_path):
         """Applies resolution to file successfully."""
         test_file = tmp_path / 'test.txt'
-        test_file.write_text('''line1
-<<<<<<< HEAD
-master
-=======
-feature
->>>>>>> feature
-line2
-''')
+        test_file.write_text(EMBEDDED_CONFLICT)
 
         conflict = {
             'start_line': 2,
@@ -213,7 +196,7 @@ line2
         assert 'line1' in content
         assert 'line2' in content
 
-    def test_apply_resolution_nonexistent_fails(self, tmp_path, capsys):
+    def test_apply_resolution_nonexistent_fails(self, tmp_path):
         """Returns False for nonexistent file."""
         conflict = {'start_line': 1, 'end_line': 5}
         result = apply_resolution(str(tmp_path / 'nonexistent.txt'), conflict, 'content')
@@ -223,6 +206,7 @@ line2
 class TestMain:
     """Tests for main() entry point."""
 
+    @pytest.mark.git
     def test_main_not_git_repo_exits_1(self, tmp_path, monkeypatch, capsys):
         """Exits with error when not in git repo."""
         monkeypatch.chdir(tmp_path)
@@ -235,7 +219,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert 'not inside a git repository' in captured.err.lower()
 
-    def test_main_no_conflicts_exits_0(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_no_conflicts_exits_0(self, mock_git_repo, monkeypatch, capsys, shared_mock_config):
         """Exits cleanly when no conflicts."""
         monkeypatch.chdir(mock_git_repo)
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict'])
@@ -247,7 +231,7 @@ class TestMain:
         captured = capsys.readouterr()
         assert 'no conflicted files' in captured.out.lower()
 
-    def test_main_dry_run_flag_accepted(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_dry_run_flag_accepted(self, mock_git_repo, monkeypatch, shared_mock_config):
         """Accepts --dry-run flag."""
         monkeypatch.chdir(mock_git_repo)
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict', '--dry-run'])
@@ -258,7 +242,7 @@ class TestMain:
         # Should exit 0 (no conflicts to process)
         assert exc_info.value.code == 0
 
-    def test_main_yes_flag_accepted(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_yes_flag_accepted(self, mock_git_repo, monkeypatch, shared_mock_config):
         """Accepts -y flag."""
         monkeypatch.chdir(mock_git_repo)
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict', '-y'])
@@ -269,18 +253,13 @@ class TestMain:
         # Should exit 0 (no conflicts to process)
         assert exc_info.value.code == 0
 
-    def test_main_specific_file(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_specific_file(self, mock_git_repo, monkeypatch, shared_mock_config):
         """Accepts specific file argument."""
         monkeypatch.chdir(mock_git_repo)
 
         # Create a file with conflict markers
         conflict_file = mock_git_repo / 'conflict.txt'
-        conflict_file.write_text('''<<<<<<< HEAD
-master
-=======
-feature
->>>>>>> feature
-''')
+        conflict_file.write_text(BARE_CONFLICT)
 
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict', str(conflict_file)])
 
@@ -297,7 +276,7 @@ feature
 
         # If we got here without argument error, the argument was accepted
 
-    def test_main_file_not_found_exits_1(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_file_not_found_exits_1(self, mock_git_repo, monkeypatch, capsys, shared_mock_config):
         """Exits with error when specified file not found."""
         monkeypatch.chdir(mock_git_repo)
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict', 'nonexistent.txt'])
@@ -309,18 +288,13 @@ feature
         captured = capsys.readouterr()
         assert 'not found' in captured.err.lower()
 
-    def test_main_processes_conflict(self, mock_git_repo, monkeypatch, capsys, mock_config):
+    def test_main_processes_conflict(self, mock_git_repo, monkeypatch, shared_mock_config):
         """Processes conflict file and calls resolve_conflict."""
         monkeypatch.chdir(mock_git_repo)
 
         # Create a file with conflict markers
         conflict_file = mock_git_repo / 'conflict.txt'
-        conflict_file.write_text('''<<<<<<< HEAD
-master
-=======
-feature
->>>>>>> feature
-''')
+        conflict_file.write_text(BARE_CONFLICT)
 
         monkeypatch.setattr(sys, 'argv', ['resolve-conflict', '--dry-run', str(conflict_file)])
 
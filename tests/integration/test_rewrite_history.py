@@ -1,77 +1,57 @@
 """Integration tests for ab_cli.commands.rewrite_history module."""
-import subprocess
 import sys
 from unittest.mock import patch
 
 import pytest
 
 from ab_cli.commands.rewrite_history import (
-    check_commits_pushed,
-    count_words,
     create_backup_branch,
     get_commit_diff,
     get_commit_files,
     get_commit_message,
     get_commit_subject,
-    get_short_hash,
-    has_remotes,
     has_uncommitted_changes,
     is_merge_commit,
     list_commits,
     main,
 )
+from tests.support.cat_file import CatFileServer
+from tests.support.git_fast import (
+    build_scenario,
+    commit_block,
+    commit_file,
+    git,
+    head_sha,
+)
 
 
-class TestMergeCommitDetection:
-    """Tests for merge commit detection."""
-
-    def test_is_merge_commit_false(self, mock_git_repo, monkeypatch):
-        """Non-merge commit returns False."""
-        monkeypatch.chdir(mock_git_repo)
+@pytest.fixture
+def cat_file(mock_git_repo):
+    """Long-lived git cat-file reader for verifying commits in mock_git_repo."""
+    with CatFileServer(mock_git_repo) as server:
+        yield server
 
-        # Get initial commit hash
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
 
-        assert is_merge_commit(commit_hash) is False
+class TestMergeCommitDetection:
+    """Tests for merge commit detection."""
 
-    def test_is_merge_commit_true(self, mock_git_repo, monkeypatch):
+    def test_is_merge_commit_true(self, mock_git_repo, monkeypatch, cat_file):
         """Merge commit returns True."""
         monkeypatch.chdir(mock_git_repo)
 
         # Create a branch and merge it
-        subprocess.run(["git", "checkout", "-b", "feature"], cwd=mock_git_repo, check=True)
-        (mock_git_repo / "feature.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Feature commit"], cwd=mock_git_repo, check=True)
-
-        subprocess.run(["git", "checkout", "master"], cwd=mock_git_repo, check=True)
-        (mock_git_repo / "master.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Master commit"], cwd=mock_git_repo, check=True)
-
-        subprocess.run(
-            ["git", "merge", "--no-ff", "feature", "-m", "Merge feature"],
-            cwd=mock_git_repo,
-            check=True
-        )
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        merge_hash = result.stdout.strip()
+        build_scenario(mock_git_repo, (
+            commit_block("refs/heads/feature", "Feature commit", {"feature.txt": "content"},
+                         parent="refs/heads/master^0", mark=1)
+            + commit_block("refs/heads/master", "Master commit", {"master.txt": "content"},
+                           parent="refs/heads/master^0", mark=2)
+            + commit_block("refs/heads/master", "Merge feature", parent=":2", merge=":1")
+        ))
+
+        merge_hash = head_sha(mock_git_repo)
 
         assert is_merge_commit(merge_hash) is True
+        assert len(cat_file.parents(merge_hash)) == 2
 
 
 class TestUncommittedChanges:
@@ -97,7 +77,7 @@ class TestUncommittedChanges:
 
         # Stage a new file
         (mock_git_repo / "new.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
+        git(mock_git_repo, "add", ".")
 
         assert has_uncommitted_changes() is True
 
@@ -110,10 +90,11 @@ class TestListCommits:
         monkeypatch.chdir(mock_git_repo)
 
         # Create more commits
-        for i in range(3):
-            (mock_git_repo / f"file{i}.txt").write_text(f"content{i}")
-            subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-            subprocess.run(["git", "commit", "-m", f"Commit {i}"], cwd=mock_git_repo, check=True)
+        build_scenario(mock_git_repo, "".join(
+            commit_block("refs/heads/master", f"Commit {i}", {f"file{i}.txt": f"content{i}"},
+                         parent="refs/heads/master^0" if i == 0 else None)
+            for i in range(3)
+        ))
 
         commits = list_commits("HEAD~3..HEAD")
         assert len(commits) == 3
@@ -123,9 +104,7 @@ class TestListCommits:
         monkeypatch.chdir(mock_git_repo)
 
         # Create more commits
-        (mock_git_repo / "file.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Second commit"], cwd=mock_git_repo, check=True)
+        commit_file(mock_git_repo, "file.txt", "content", "Second commit")
 
         commits = list_commits("--root")
         assert len(commits) >= 2  # Initial + Second
@@ -143,14 +122,7 @@ class TestBackupBranch:
         assert branch_name.startswith("backup/pre-rewrite-")
 
         # Verify branch exists
-        result = subprocess.run(
-            ["git", "branch", "--list", branch_name],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        assert branch_name in result.stdout
+        assert branch_name in git(mock_git_repo, "branch", "--list", branch_name)
 
     def test_create_backup_branch_custom_name(self, mock_git_repo, monkeypatch):
         """Creates backup branch with custom name."""
@@ -161,98 +133,17 @@ class TestBackupBranch:
         assert branch_name == "custom/backup-name"
 
 
-class TestCommitsPushed:
-    """Tests for pushed commits detection."""
-
-    def test_check_commits_pushed_no_remotes(self, mock_git_repo, monkeypatch):
-        """Returns False when no remotes configured."""
-        monkeypatch.chdir(mock_git_repo)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
-
-        assert check_commits_pushed(commit_hash) is False
-
-    def test_has_remotes_false(self, mock_git_repo, monkeypatch):
-        """Returns False when no remotes."""
-        monkeypatch.chdir(mock_git_repo)
-        assert has_remotes() is False
-
-
 class TestCommitOperations:
     """Tests for commit information operations."""
 
-    def test_get_commit_message(self, mock_git_repo, monkeypatch):
-        """Returns full commit message."""
-        monkeypatch.chdir(mock_git_repo)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
-
-        message = get_commit_message(commit_hash)
-        assert "Initial commit" in message
-
-    def test_get_commit_subject(self, mock_git_repo, monkeypatch):
-        """Returns commit subject line."""
-        monkeypatch.chdir(mock_git_repo)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
-
-        subject = get_commit_subject(commit_hash)
-        assert "Initial commit" in subject
-
-    def test_get_short_hash(self, mock_git_repo, monkeypatch):
-        """Returns short hash."""
-        monkeypatch.chdir(mock_git_repo)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
-
-        short_hash = get_short_hash(commit_hash)
-        assert len(short_hash) == 7  # Default short hash length
-
     def test_get_commit_diff(self, mock_git_repo, monkeypatch):
         """Returns commit diff."""
         monkeypatch.chdir(mock_git_repo)
 
         # Create a new commit with changes
-        (mock_git_repo / "test.txt").write_text("test content\n")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Add test file"], cwd=mock_git_repo, check=True)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
+        commit_file(mock_git_repo, "test.txt", "test content\n", "Add test file")
+
+        commit_hash = head_sha(mock_git_repo)
 
         diff = get_commit_diff(commit_hash)
         assert "+test content" in diff
@@ -262,43 +153,33 @@ class TestCommitOperations:
         monkeypatch.chdir(mock_git_repo)
 
         # Create a new commit with a file change (initial commits may not show files)
-        (mock_git_repo / "testfile.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Add testfile"], cwd=mock_git_repo, check=True)
-
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        commit_hash = result.stdout.strip()
+        commit_file(mock_git_repo, "testfile.txt", "content", "Add testfile")
+
+        commit_hash = head_sha(mock_git_repo)
 
         files = get_commit_files(commit_hash)
         assert "testfile.txt" in files
 
+    def test_commit_message_and_subject(self, mock_git_repo, monkeypatch, cat_file):
+        """Message and subject match the stored commit object."""
+        monkeypatch.chdir(mock_git_repo)
 
-class TestCountWords:
-    """Tests for word counting utility."""
-
-    def test_count_words_simple(self):
-        """Counts words correctly."""
-        assert count_words("one two three") == 3
+        build_scenario(mock_git_repo, commit_block(
+            "refs/heads/master", "Add feature\n\nLonger explanation.\n",
+            {"feature.txt": "content"}, parent="refs/heads/master^0"
+        ))
 
-    def test_count_words_empty(self):
-        """Returns 0 for empty string."""
-        assert count_words("") == 0
+        commit_hash = head_sha(mock_git_repo)
 
-    def test_count_words_multiline(self):
-        """Counts words across lines."""
-        assert count_words("line one\nline two") == 4
+        assert get_commit_message(commit_hash) == cat_file.message(commit_hash)
+        assert get_commit_subject(commit_hash) == cat_file.subject(commit_hash) == "Add feature"
 
 
 class TestMain:
     """Tests for main() entry point."""
 
-    def test_main_not_git_repo_exits_1(self, tmp_path, monkeypatch, capsys):
+    @pytest.mark.git
+    def test_main_not_git_repo_exits_1(self, tmp_path, monkeypatch):
         """Exits with error when not in git repository."""
         monkeypatch.chdir(tmp_path)
         monkeypatch.setattr(sys, "argv", ["rewrite-history", "--dry-run"])
@@ -313,9 +194,7 @@ class TestMain:
         monkeypatch.chdir(mock_git_repo)
 
         # Create more commits first so HEAD~1..HEAD works
-        (mock_git_repo / "file1.txt").write_text("content1")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Second commit"], cwd=mock_git_repo, check=True)
+        commit_file(mock_git_repo, "file1.txt", "content1", "Second commit")
 
         # Now create uncommitted changes by modifying a tracked file
         (mock_git_repo / "file1.txt").write_text("modified content")
@@ -330,25 +209,19 @@ class TestMain:
         captured = capsys.readouterr()
         assert "uncommitted changes" in captured.err.lower()
 
-    def test_main_dry_run(self, mock_git_repo, monkeypatch, capsys):
+    def test_main_dry_run(self, mock_git_repo, monkeypatch, capfdbinary, cat_file):
         """'--dry-run' makes no changes."""
         monkeypatch.chdir(mock_git_repo)
 
         # Create commits to analyze
-        for i in range(2):
-            (mock_git_repo / f"file{i}.txt").write_text(f"content{i}")
-            subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-            subprocess.run(["git", "commit", "-m", "fix"], cwd=mock_git_repo, check=True)
+        build_scenario(mock_git_repo, (
+            commit_block("refs/heads/master", "fix", {"file0.txt": "content0"},
+                         parent="refs/heads/master^0")
+            + commit_block("refs/heads/master", "fix", {"file1.txt": "content1"})
+        ))
 
         # Get initial HEAD
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        initial_head = result.stdout.strip()
+        initial_head = head_sha(mock_git_repo)
 
         monkeypatch.setattr(sys, "argv", ["rewrite-history", "--dry-run", "--force-all", "HEAD~2..HEAD"])
 
@@ -358,44 +231,28 @@ class TestMain:
 
             assert exc_info.value.code == 0
 
-        # Verify HEAD unchanged
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=mock_git_repo,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        assert result.stdout.strip() == initial_head
+        # Verify HEAD and the analyzed messages unchanged
+        assert head_sha(mock_git_repo) == initial_head
+        assert [cat_file.message(rev) for rev in ("HEAD", "HEAD~1")] == ["fix", "fix"]
 
-        captured = capsys.readouterr()
-        assert "Dry-run mode" in captured.out
+        out, _ = capfdbinary.readouterr()
+        assert b"Dry-run mode" in out
 
     def test_main_skip_merges_flag(self, mock_git_repo, monkeypatch, capsys):
         """'--skip-merges' skips merge commits."""
         monkeypatch.chdir(mock_git_repo)
 
-        # Create additional commit on master first
-        (mock_git_repo / "base.txt").write_text("base content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Base commit"], cwd=mock_git_repo, check=True)
-
-        # Create a merge commit
-        subprocess.run(["git", "checkout", "-b", "feature"], cwd=mock_git_repo, check=True)
-        (mock_git_repo / "feature.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Feature"], cwd=mock_git_repo, check=True)
-
-        subprocess.run(["git", "checkout", "master"], cwd=mock_git_repo, check=True)
-        (mock_git_repo / "master.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
-        subprocess.run(["git", "commit", "-m", "Master"], cwd=mock_git_repo, check=True)
-
-        subprocess.run(
-            ["git", "merge", "--no-ff", "feature", "-m", "Merge"],
-            cwd=mock_git_repo,
-            check=True
-        )
+        build_scenario(mock_git_repo, (
+            # Create additional commit on master first
+            commit_block("refs/heads/master", "Base commit", {"base.txt": "base content"},
+                         parent="refs/heads/master^0", mark=1)
+            # Create a merge commit
+            + commit_block("refs/heads/feature", "Feature", {"feature.txt": "content"},
+                           parent=":1", mark=2)
+            + commit_block("refs/heads/master", "Master", {"master.txt": "content"},
+                           parent=":1", mark=3)
+            + commit_block("refs/heads/master", "Merge", parent=":3", merge=":2")
+        ))
 
         # Use HEAD~3..HEAD to cover the commits including merge (now we have enough)
         monkeypatch.setattr(sys, "argv", [
@@ -0,0 +1,66 @@
+"""Read git commit objects through one long-lived ``git cat-file --batch``.
+
+Used as an independent oracle in tests: checking several commits costs a
+pipe round-trip each instead of a new git process per query.
+"""
+import subprocess
+from pathlib import Path
+from typing import List, Tuple
+
+
+class CatFileServer:
+    """Serve commit objects from a single ``git cat-file --batch`` process."""
+
+    def __init__(self, repo: Path):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=65536
+        )
+
+    def read(self, rev: str) -> Tuple[str, bytes]:
+        """Return (object type, raw content) for rev."""
+        self._proc.stdin.write(rev.encode() + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().decode().split()
+        if header[-1] == "missing":
+            raise KeyError(rev)
+        _, obj_type, size = header
+        content = self._proc.stdout.read(int(size))
+        self._proc.stdout.read(1)  # trailing newline
+        return obj_type, content
+
+    def _commit(self, rev: str) -> Tuple[List[str], str]:
+        """Split a commit object into header lines and message."""
+        obj_type, content = self.read(rev)
+        if obj_type != "commit":
+            raise ValueError(f"{rev} is a {obj_type}, not a commit")
+        headers, _, message = content.decode().partition("\n\n")
+        return headers.split("\n"), message
+
+    def parents(self, rev: str) -> List[str]:
+        """Return the parent hashes of a commit."""
+        headers, _ = self._commit(rev)
+        return [line.split()[1] for line in headers if line.startswith("parent ")]
+
+    def message(self, rev: str) -> str:
+        """Return the full commit message, like ``git log --format=%B``."""
+        return self._commit(rev)[1].strip()
+
+    def subject(self, rev: str) -> str:
+        """Return the subject, like ``git log --format=%s``."""
+        return " ".join(self.message(rev).split("\n\n")[0].split("\n"))
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        self._proc.stdin.close()
+        self._proc.wait()
+        self._proc.stdout.close()
+
+    def __enter__(self) -> "CatFileServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
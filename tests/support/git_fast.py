@@ -0,0 +1,85 @@
+"""Helpers for preparing git repository state in tests.
+
+These only build the scenario a test needs; code under test still runs
+its own git commands. Each helper issues as few git processes as possible.
+"""
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+COMMITTER = "Test User <test@example.com> now"
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run a git command in repo and return its stripped stdout.
+
+    stderr is not piped: pytest's fd capture records it and shows it only
+    when a test fails.
+    """
+    return subprocess.check_output(["git", *args], cwd=repo, text=True).strip()
+
+
+def commit_file(repo: Path, path: str, content: str, message: str) -> None:
+    """Write path with content and commit it on the current branch."""
+    (repo / path).write_text(content)
+    git(repo, "add", "--", path)
+    git(repo, "commit", "-q", "-m", message)
+
+
+def head_sha(repo: Path) -> str:
+    """Return the full hash of HEAD.
+
+    Reads .git/HEAD and the loose ref it points to directly; falls back to
+    ``git rev-parse`` when the branch only exists in packed-refs.
+    """
+    git_dir = repo / ".git"
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head
+    ref_file = git_dir / head[len("ref: "):]
+    if ref_file.is_file():
+        return ref_file.read_text().strip()
+    return git(repo, "rev-parse", "HEAD")
+
+
+def commit_block(
+    ref: str,
+    message: str,
+    files: Optional[Dict[str, str]] = None,
+    parent: Optional[str] = None,
+    merge: Optional[str] = None,
+    mark: Optional[int] = None,
+) -> str:
+    """Format one commit for a git fast-import stream.
+
+    parent/merge accept anything fast-import understands, e.g. ':1' or
+    'refs/heads/master^0' (needed to extend a branch that already exists).
+    """
+    lines = [f"commit {ref}"]
+    if mark is not None:
+        lines.append(f"mark :{mark}")
+    lines += [f"committer {COMMITTER}", "data <<EOT", message, "EOT"]
+    if parent:
+        lines.append(f"from {parent}")
+    if merge:
+        lines.append(f"merge {merge}")
+    for path, content in (files or {}).items():
+        lines += [f"M 644 inline {path}", "data <<EOT", content, "EOT"]
+    return "\n".join(lines) + "\n\n"
+
+
+def build_scenario(repo: Path, script: str) -> None:
+    """Feed a fast-import script to repo, then sync index and work tree to HEAD.
+
+    Builds any number of commits, branches and merges with two git
+    processes instead of an add/commit/checkout/merge call per step.
+    """
+    subprocess.run(
+        ["git", "fast-import", "--quiet", "--date-format=now"],
+        cwd=repo,
+        input=script,
+        stdout=subprocess.DEVNULL,
+        text=True,
+        check=True
+    )
+    git(repo, "reset", "-q", "--hard")
@@ -2,6 +2,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from ab_cli.core.config import (
     AbConfig,
     DEFAULT_CONFIG,
@@ -17,48 +19,40 @@ class TestAbConfigSingleton:
     """Tests for AbConfig singleton pattern."""
 
     def test_singleton_pattern(self, temp_config_dir):
-        """AbConfig returns same instance on multiple calls."""
-        config1 = AbConfig()
-        config2 = AbConfig()
-        assert config1 is config2
-
-    def test_get_config_returns_singleton(self, temp_config_dir):
-        """get_config() returns the same AbConfig instance."""
-        config1 = get_config()
-        config2 = get_config()
-        assert config1 is config2
+        """AbConfig() and get_config() always return the same instance."""
+        assert AbConfig() is AbConfig() is get_config() is get_config()
 
 
 class TestAbConfigGet:
     """Tests for AbConfig.get() method."""
 
-    def test_get_with_dot_notation(self, mock_config):
+    def test_get_with_dot_notation(self, shared_mock_config):
         """get('global.language') works with dot notation."""
         config = get_config()
         assert config.get("global.language") == "en"
 
-    def test_get_nested_path(self, mock_config):
+    def test_get_nested_path(self, shared_mock_config):
         """Deep paths like 'models.thresholds.small_max_tokens' work."""
         config = get_config()
         assert config.get("models.thresholds.small_max_tokens") == 128000
 
-    def test_get_missing_key_returns_default(self, mock_config):
+    def test_get_missing_key_returns_default(self, shared_mock_config):
         """Missing keys return the default value."""
         config = get_config()
         assert config.get("nonexistent.key") is None
         assert config.get("nonexistent.key", "fallback") == "fallback"
 
-    def test_get_top_level_key(self, mock_config):
+    def test_get_top_level_key(self, shared_mock_config):
         """Top-level keys work without dot notation."""
         config = get_config()
         assert config.get("version") == "1.0"
 
-    def test_get_returns_none_for_partial_path(self, mock_config):
+    def test_get_returns_none_for_partial_path(self, shared_mock_config):
         """Partial paths that don't exist return None."""
         config = get_config()
         assert config.get("global.nonexistent") is None
 
-    def test_get_with_default_returns_value_when_exists(self, mock_config):
+    def test_get_with_default_returns_value_when_exists(self, shared_mock_config):
         """get_with_default returns config value when it exists."""
         config = get_config()
         assert config.get_with_default("global.language") == "en"
@@ -73,33 +67,21 @@ class TestAbConfigGet:
 class TestAbConfigSet:
     """Tests for AbConfig.set() method."""
 
-    def test_set_existing_path(self, mock_config, temp_config_dir):
+    def test_set_existing_path(self, mock_config):
         """Setting an existing path updates the value."""
-        from ab_cli.core import config as config_module
-
         config = get_config()
         config.set("global.language", "pt-br")
         assert config.get("global.language") == "pt-br"
+        assert config.to_dict()["global"]["language"] == "pt-br"
 
-        # Verify persisted to file
-        with open(config_module.AB_CONFIG_FILE) as f:
-            saved = json.load(f)
-        assert saved["global"]["language"] == "pt-br"
-
-    def test_set_creates_nested_structure(self, mock_config, temp_config_dir):
+    def test_set_creates_nested_structure(self, mock_config):
         """set('new.nested.path', value) creates parent dicts."""
-        from ab_cli.core import config as config_module
-
         config = get_config()
         config.set("custom.new.setting", "test_value")
         assert config.get("custom.new.setting") == "test_value"
+        assert config.to_dict()["custom"]["new"] == {"setting": "test_value"}
 
-        # Verify persisted
-        with open(config_module.AB_CONFIG_FILE) as f:
-            saved = json.load(f)
-        assert saved["custom"]["new"]["setting"] == "test_value"
-
-    def test_set_persists_to_file(self, mock_config, temp_config_dir):
+    def test_set_persists_to_file(self, mock_config):
         """Changes are saved to config.json."""
         from ab_cli.core import config as config_module
 
@@ -114,51 +96,52 @@ class TestAbConfigSet:
 class TestAbConfigSelectModel:
     """Tests for AbConfig.select_model() method."""
 
-    def test_select_model_small(self, mock_config):
-        """Tokens <= 128k returns small model."""
-        config = get_config()
-        assert config.select_model(50000) == "test/model-small"
-        assert config.select_model(128000) == "test/model-small"
-
-    def test_select_model_medium(self, mock_config):
-        """Tokens <= 256k returns medium model."""
-        config = get_config()
-        assert config.select_model(128001) == "test/model-medium"
-        assert config.select_model(256000) == "test/model-medium"
-
-    def test_select_model_large(self, mock_config):
-        """Tokens > 256k returns large model."""
-        config = get_config()
-        assert config.select_model(256001) == "test/model-large"
-        assert config.select_model(500000) == "test/model-large"
-
-    def test_select_model_uses_thresholds(self, mock_config, temp_config_dir):
+    @pytest.mark.parametrize("tokens,expected", [
+        (50000, "test/model-small"),
+        (128000, "test/model-small"),
+        (128001, "test/model-medium"),
+        (256000, "test/model-medium"),
+        (256001, "test/model-large"),
+        (500000, "test/model-large"),
+    ])
+    def test_select_model(self, shared_mock_config, tokens, expected):
+        """Tokens <= 128k pick small, <= 256k medium, anything above large."""
+        assert get_config().select_model(tokens) == expected
+
+    def test_select_model_uses_thresholds(self, mock_config):
         """Model selection respects configured thresholds."""
         config = get_config()
         # Update thresholds
         config.set("models.thresholds.small_max_tokens", 50000)
-        config.reload()
 
         # Now 60000 tokens should select medium
         assert config.select_model(60000) == "test/model-medium"
 
+    def test_select_model_unsorted_thresholds(self, mock_config):
+        """The small threshold is checked first even when it exceeds the medium one."""
+        config = get_config()
+        config.set("models.thresholds.small_max_tokens", 300000)
+
+        # medium_max_tokens stays at 256000
+        assert config.select_model(270000) == "test/model-small"
+
 
 class TestAbConfigCommandSettings:
     """Tests for AbConfig.get_command_setting() method."""
 
-    def test_get_command_setting_specific(self, mock_config):
+    def test_get_command_setting_specific(self, shared_mock_config):
         """Command-specific settings override global."""
         config = get_config()
-        # auto-commit has language=pt-br in mock_config
+        # auto-commit has language=pt-br in the mock config
         assert config.get_command_setting("auto-commit", "language") == "pt-br"
 
-    def test_get_command_setting_fallback_global(self, mock_config):
+    def test_get_command_setting_fallback_global(self, shared_mock_config):
         """Falls back to global when command-specific missing."""
         config = get_config()
         # pr-description has no language setting
         assert config.get_command_setting("pr-description", "language") == "en"
 
-    def test_get_command_setting_fallback_default(self, mock_config):
+    def test_get_command_setting_fallback_default(self, shared_mock_config):
         """Falls back to default when both missing."""
         config = get_config()
         assert config.get_command_setting("any-command", "nonexistent", "fallback") == "fallback"
@@ -177,7 +160,7 @@ class TestAbConfigInit:
         assert result is True
         assert config_module.AB_CONFIG_FILE.exists()
 
-    def test_init_config_existing_returns_false(self, mock_config):
+    def test_init_config_existing_returns_false(self, shared_mock_config):
         """Returns False if config already exists."""
         config = get_config()
         result = config.init_config()
@@ -187,7 +170,7 @@ class TestAbConfigInit:
 class TestAbConfigReload:
     """Tests for AbConfig.reload() method."""
 
-    def test_reload_picks_up_changes(self, mock_config, temp_config_dir):
+    def test_reload_picks_up_changes(self, mock_config):
         """File changes reflected after reload."""
         from ab_cli.core import config as config_module
 
@@ -200,11 +183,30 @@ class TestAbConfigReload:
         with open(config_module.AB_CONFIG_FILE, "w") as f:
             json.dump(data, f)
 
-        # Before reload, still old value (cached)
-        # After reload, new value
         config.reload()
         assert config.get("global.language") == "modified"
 
+    def test_get_picks_up_file_changes_without_reload(self, mock_config):
+        """A changed config file is re-read on the next access."""
+        from ab_cli.core import config as config_module
+
+        config = get_config()
+        assert config.get("global.language") == "en"
+
+        data = json.loads(config_module.AB_CONFIG_FILE.read_text())
+        data["global"]["language"] = "modified"
+        config_module.AB_CONFIG_FILE.write_text(json.dumps(data))
+
+        assert config.get("global.language") == "modified"
+
+    def test_set_does_not_trigger_reload(self, mock_config, monkeypatch):
+        """Saving records the new file state, so the next get() skips parsing."""
+        config = get_config()
+        config.set("global.language", "fr")
+
+        monkeypatch.setattr(config, "_load", lambda: pytest.fail("config was re-parsed"))
+        assert config.get("global.language") == "fr"
+
 
 class TestAbConfigMisc:
     """Tests for miscellaneous AbConfig methods."""
@@ -218,7 +220,7 @@ class TestAbConfigMisc:
 
         assert result == {"a": {"b": 10, "c": 2, "d": 3}}
 
-    def test_config_exists_true(self, mock_config):
+    def test_config_exists_true(self, shared_mock_config):
         """config_exists() returns True when file exists."""
         config = get_config()
         assert config.config_exists() is True
@@ -228,19 +230,19 @@ class TestAbConfigMisc:
         config = get_config()
         assert config.config_exists() is False
 
-    def test_get_history_dir(self, mock_config, temp_config_dir):
+    def test_get_history_dir(self, mock_config):
         """Returns correct history directory path."""
         config = get_config()
         history_dir = config.get_history_dir()
         assert isinstance(history_dir, Path)
         assert "history" in str(history_dir)
 
-    def test_is_history_enabled(self, mock_config):
+    def test_is_history_enabled(self, shared_mock_config):
         """is_history_enabled returns config value."""
         config = get_config()
         assert config.is_history_enabled() is True
 
-    def test_to_dict(self, mock_config):
+    def test_to_dict(self, shared_mock_config):
         """to_dict returns full config as dictionary."""
         config = get_config()
         data = config.to_dict()
@@ -248,6 +250,11 @@ class TestAbConfigMisc:
         assert "version" in data
         assert "global" in data
 
+    def test_to_json(self, shared_mock_config):
+        """to_json serializes the same data as to_dict."""
+        config = get_config()
+        assert json.loads(config.to_json()) == config.to_dict()
+
     def test_get_config_path(self, temp_config_dir):
         """get_config_path returns correct path."""
         from ab_cli.core import config as config_module
@@ -262,7 +269,7 @@ class TestAbConfigMisc:
         path = AbConfig.get_config_dir()
         assert path == config_module.AB_CONFIG_DIR
 
-    def test_get_api_settings(self, mock_config):
+    def test_get_api_settings(self, shared_mock_config):
         """get_api_settings returns API configuration."""
         config = get_config()
         settings = config.get_api_settings()
@@ -274,18 +281,14 @@ class TestAbConfigMisc:
 class TestEstimateTokens:
     """Tests for estimate_tokens function."""
 
-    def test_estimate_tokens_basic(self):
-        """estimate_tokens returns ~len/4."""
-        text = "a" * 100
-        assert estimate_tokens(text) == 25
-
-    def test_estimate_tokens_empty(self):
-        """estimate_tokens handles empty string."""
-        assert estimate_tokens("") == 0
-
-    def test_estimate_tokens_short(self):
-        """estimate_tokens handles short text."""
-        assert estimate_tokens("hi") == 0  # 2 // 4 = 0
+    @pytest.mark.parametrize("text,expected", [
+        ("a" * 100, 25),
+        ("", 0),
+        ("hi", 0),  # 2 // 4 = 0
+    ], ids=["basic", "empty", "short"])
+    def test_estimate_tokens(self, text, expected):
+        """estimate_tokens returns len // 4."""
+        assert estimate_tokens(text) == expected
 
 
 class TestConvenienceFunctions:
@@ -296,17 +299,17 @@ class TestConvenienceFunctions:
         lang = get_language()
         assert lang == "en"
 
-    def test_get_language_for_command(self, mock_config):
+    def test_get_language_for_command(self, shared_mock_config):
         """get_language returns command-specific language."""
         lang = get_language("auto-commit")
         assert lang == "pt-br"
 
-    def test_get_default_model(self, mock_config):
+    def test_get_default_model(self, shared_mock_config):
         """get_default_model returns configured default."""
         model = get_default_model()
         assert model == "test/model-small"
 
-    def test_select_model_for_tokens(self, mock_config):
+    def test_select_model_for_tokens(self, shared_mock_config):
         """select_model_for_tokens delegates to AbConfig."""
         model = select_model_for_tokens(50000)
         assert model == "test/model-small"
@@ -14,9 +14,18 @@ from ab_cli.commands.config_cli import (
     cmd_show,
     main,
 )
+from ab_cli.core import config as config_module
 from ab_cli.core.config import DEFAULT_CONFIG, get_config
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _argv_snapshot():
+    """TestMain assigns sys.argv directly; restore it once after the module."""
+    original = sys.argv[:]
+    yield
+    sys.argv[:] = original
+
+
 class TestCmdShow:
     """Tests for cmd_show command."""
 
@@ -83,59 +92,25 @@ class TestCmdGet:
 class TestCmdSet:
     """Tests for cmd_set command."""
 
-    def test_cmd_set_string_value(self, mock_config, capsys, temp_config_dir):
-        """Sets string value correctly."""
-        args = Namespace(key="global.language", value="fr")
-        cmd_set(args)
+    @pytest.mark.parametrize("key,raw,expected", [
+        ("global.language", "fr", "fr"),
+        ("history.enabled", "true", True),
+        ("history.enabled", "false", False),
+        ("global.timeout_seconds", "600", 600),
+        ("custom.data", '{"nested": true}', {"nested": True}),
+    ], ids=["string", "bool_true", "bool_false", "int", "json"])
+    def test_cmd_set_coerces_value(self, mock_config, capsys, read_config_file, key, raw, expected):
+        """String values are converted to bool/int/JSON types before saving."""
+        cmd_set(Namespace(key=key, value=raw))
 
-        # Verify set
-        config = get_config()
-        config.reload()
-        assert config.get("global.language") == "fr"
+        section, name = key.split(".")
+        assert read_config_file()[section][name] == expected
 
         captured = capsys.readouterr()
-        assert "Set global.language = fr" in captured.out
-
-    def test_cmd_set_bool_true(self, mock_config, capsys, temp_config_dir):
-        """'true' string converts to True boolean."""
-        args = Namespace(key="history.enabled", value="true")
-        cmd_set(args)
-
-        config = get_config()
-        config.reload()
-        assert config.get("history.enabled") is True
-
-    def test_cmd_set_bool_false(self, mock_config, capsys, temp_config_dir):
-        """'false' string converts to False boolean."""
-        args = Namespace(key="history.enabled", value="false")
-        cmd_set(args)
-
-        config = get_config()
-        config.reload()
-        assert config.get("history.enabled") is False
-
-    def test_cmd_set_int_value(self, mock_config, capsys, temp_config_dir):
-        """Numeric string converts to integer."""
-        args = Namespace(key="global.timeout_seconds", value="600")
-        cmd_set(args)
-
-        config = get_config()
-        config.reload()
-        assert config.get("global.timeout_seconds") == 600
-
-    def test_cmd_set_json_value(self, mock_config, capsys, temp_config_dir):
-        """JSON string is parsed correctly."""
-        args = Namespace(key="custom.data", value='{"nested": true}')
-        cmd_set(args)
-
-        config = get_config()
-        config.reload()
-        assert config.get("custom.data") == {"nested": True}
+        assert f"Set {key} = " in captured.out
 
     def test_cmd_set_auto_creates_config(self, temp_config_dir, capsys):
         """Auto-creates config if it doesn't exist."""
-        from ab_cli.core import config as config_module
-
         args = Namespace(key="global.language", value="de")
         cmd_set(args)
 
@@ -149,8 +124,6 @@ class TestCmdInit:
 
     def test_cmd_init_creates_config(self, temp_config_dir, capsys):
         """Creates default config file."""
-        from ab_cli.core import config as config_module
-
         args = Namespace(force=False)
         cmd_init(args)
 
@@ -169,14 +142,8 @@ class TestCmdInit:
         captured = capsys.readouterr()
         assert "Config already exists" in captured.out
 
-    def test_cmd_init_force_overwrites(self, mock_config, temp_config_dir, capsys, monkeypatch):
+    def test_cmd_init_force_overwrites(self, mock_config, capsys):
         """--force replaces existing config."""
-        from ab_cli.core import config as config_module
-        from ab_cli.commands import config_cli
-
-        # Patch the AB_CONFIG_FILE in config_cli module
-        monkeypatch.setattr(config_cli, "AB_CONFIG_FILE", config_module.AB_CONFIG_FILE)
-
         # Modify existing config
         config = get_config()
         config.set("global.language", "custom")
@@ -196,14 +163,8 @@ class TestCmdInit:
 class TestCmdPath:
     """Tests for cmd_path command."""
 
-    def test_cmd_path_shows_path(self, temp_config_dir, capsys, monkeypatch):
+    def test_cmd_path_shows_path(self, temp_config_dir, capsys):
         """Shows config file path."""
-        from ab_cli.core import config as config_module
-        from ab_cli.commands import config_cli
-
-        # Also patch the AB_CONFIG_FILE in config_cli module
-        monkeypatch.setattr(config_cli, "AB_CONFIG_FILE", config_module.AB_CONFIG_FILE)
-
         args = Namespace()
         cmd_path(args)
 
@@ -220,45 +181,44 @@ class TestCmdListKeys:
         cmd_list_keys(args)
 
         captured = capsys.readouterr()
-        lines = captured.out.strip().split("\n")
 
         # Should include known keys
-        assert any("global.language" in line for line in lines)
-        assert any("models.default" in line for line in lines)
-        assert any("version" in line for line in lines)
+        assert "global.language" in captured.out
+        assert "models.default" in captured.out
+        assert "version" in captured.out
 
 
 class TestMain:
     """Tests for main() entry point."""
 
-    def test_main_no_command_shows_help(self, capsys, monkeypatch):
+    def test_main_no_command_shows_help(self):
         """No command shows help and exits 0."""
-        monkeypatch.setattr(sys, "argv", ["ab-config"])
+        sys.argv[:] = ["ab-config"]
 
         with pytest.raises(SystemExit) as exc_info:
             main()
 
         assert exc_info.value.code == 0
 
-    def test_main_show_command(self, mock_config, capsys, monkeypatch):
+    def test_main_show_command(self, mock_config, capsys):
         """'show' command works."""
-        monkeypatch.setattr(sys, "argv", ["ab-config", "show"])
+        sys.argv[:] = ["ab-config", "show"]
         main()
 
         captured = capsys.readouterr()
         assert "version" in captured.out
 
-    def test_main_get_command(self, mock_config, capsys, monkeypatch):
+    def test_main_get_command(self, mock_config, capsys):
         """'get' command works."""
-        monkeypatch.setattr(sys, "argv", ["ab-config", "get", "version"])
+        sys.argv[:] = ["ab-config", "get", "version"]
         main()
 
         captured = capsys.readouterr()
         assert "1.0" in captured.out
 
-    def test_main_path_command(self, temp_config_dir, capsys, monkeypatch):
+    def test_main_path_command(self, temp_config_dir, capsys):
         """'path' command works."""
-        monkeypatch.setattr(sys, "argv", ["ab-config", "path"])
+        sys.argv[:] = ["ab-config", "path"]
         main()
 
         captured = capsys.readouterr()
@@ -1,4 +1,7 @@
 """Unit tests for ab_cli.utils.error_handling module."""
+import subprocess
+from unittest.mock import patch
+
 import pytest
 
 from ab_cli.utils import (
@@ -8,6 +11,7 @@ from ab_cli.utils import (
     GitError,
     LLMError,
     ConfigError,
+    require_git_repo,
 )
 
 
@@ -22,56 +26,6 @@ class TestCliErrorHandler:
             result.append(2)
         assert result == [1, 2]
 
-    def test_catches_ab_cli_error_and_exits(self, capsys):
-        """Catches AbCliError and exits with code 1."""
-        with pytest.raises(SystemExit) as exc_info:
-            with cli_error_handler():
-                raise AbCliError("Test error message")
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "Test error message" in captured.err
-
-    def test_catches_git_error_subclass(self, capsys):
-        """Catches GitError (subclass of AbCliError)."""
-        with pytest.raises(SystemExit) as exc_info:
-            with cli_error_handler():
-                raise GitError("Not inside a git repository")
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "Not inside a git repository" in captured.err
-
-    def test_catches_llm_error_subclass(self, capsys):
-        """Catches LLMError (subclass of AbCliError)."""
-        with pytest.raises(SystemExit) as exc_info:
-            with cli_error_handler():
-                raise LLMError("API call failed")
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "API call failed" in captured.err
-
-    def test_catches_config_error_subclass(self, capsys):
-        """Catches ConfigError (subclass of AbCliError)."""
-        with pytest.raises(SystemExit) as exc_info:
-            with cli_error_handler():
-                raise ConfigError("Invalid configuration")
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "Invalid configuration" in captured.err
-
-    def test_catches_keyboard_interrupt(self, capsys):
-        """Catches KeyboardInterrupt and exits with code 130."""
-        with pytest.raises(SystemExit) as exc_info:
-            with cli_error_handler():
-                raise KeyboardInterrupt()
-
-        assert exc_info.value.code == 130
-        captured = capsys.readouterr()
-        assert "Aborted" in captured.out
-
     def test_does_not_catch_other_exceptions(self):
         """Does not catch non-AbCliError exceptions."""
         with pytest.raises(ValueError):
@@ -100,43 +54,6 @@ class TestHandleCliErrors:
         result = add(3, 5)
         assert result == 8
 
-    def test_catches_ab_cli_error_and_exits(self, capsys):
-        """Catches AbCliError and exits with code 1."""
-        @handle_cli_errors
-        def failing_func():
-            raise AbCliError("Decorated error")
-
-        with pytest.raises(SystemExit) as exc_info:
-            failing_func()
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "Decorated error" in captured.err
-
-    def test_catches_git_error_subclass(self, capsys):
-        """Catches GitError (subclass of AbCliError)."""
-        @handle_cli_errors
-        def git_command():
-            raise GitError("Git operation failed")
-
-        with pytest.raises(SystemExit) as exc_info:
-            git_command()
-
-        assert exc_info.value.code == 1
-        captured = capsys.readouterr()
-        assert "Git operation failed" in captured.err
-
-    def test_catches_keyboard_interrupt(self, capsys):
-        """Catches KeyboardInterrupt and exits with code 130."""
-        @handle_cli_errors
-        def interruptible():
-            raise KeyboardInterrupt()
-
-        with pytest.raises(SystemExit) as exc_info:
-            interruptible()
-
-        assert exc_info.value.code == 130
-
     def test_does_not_catch_other_exceptions(self):
         """Does not catch non-AbCliError exceptions."""
         @handle_cli_errors
@@ -164,35 +81,68 @@ class TestHandleCliErrors:
         assert documented_func.__doc__ == "This is the docstring."
 
 
+def _run_context_manager(target):
+    with cli_error_handler():
+        target()
+
+
+def _run_decorator(target):
+    handle_cli_errors(target)()
+
+
+class TestErrorExits:
+    """Exit codes and messages shared by cli_error_handler and handle_cli_errors."""
+
+    @pytest.mark.parametrize("run", [_run_context_manager, _run_decorator],
+                             ids=["context_manager", "decorator"])
+    @pytest.mark.parametrize("exc", [
+        AbCliError("Test error message"),
+        GitError("Not inside a git repository"),
+        LLMError("API call failed"),
+        ConfigError("Invalid configuration"),
+    ], ids=lambda exc: type(exc).__name__)
+    def test_ab_cli_error_exits_1(self, run, exc, capsys):
+        """AbCliError and its subclasses are logged to stderr and exit with code 1."""
+        def target():
+            raise exc
+
+        with pytest.raises(SystemExit) as exc_info:
+            run(target)
+
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert str(exc) in captured.err
+
+    @pytest.mark.parametrize("run", [_run_context_manager, _run_decorator],
+                             ids=["context_manager", "decorator"])
+    def test_keyboard_interrupt_exits_130(self, run, capsys):
+        """KeyboardInterrupt prints 'Aborted' and exits with code 130."""
+        def target():
+            raise KeyboardInterrupt()
+
+        with pytest.raises(SystemExit) as exc_info:
+            run(target)
+
+        assert exc_info.value.code == 130
+        captured = capsys.readouterr()
+        assert "Aborted" in captured.out
+
+
 class TestRequireGitRepo:
     """Tests for require_git_repo function."""
 
-    def test_require_git_repo_in_git_dir(self, mock_git_repo, monkeypatch):
-        """Does not raise when inside git repository."""
-        from ab_cli.utils import require_git_repo
-
-        monkeypatch.chdir(mock_git_repo)
-        # Should not raise
-        require_git_repo()
+    def test_require_git_repo_in_git_dir(self):
+        """Does not raise when git reports a work tree."""
+        completed = subprocess.CompletedProcess(args=["git"], returncode=0, stdout="true\n", stderr="")
+        with patch("ab_cli.utils.git_helpers.subprocess.run", return_value=completed):
+            # Should not raise
+            require_git_repo()
 
+    @pytest.mark.git
     def test_require_git_repo_outside_git_dir(self, tmp_path, monkeypatch):
         """Raises GitError when outside git repository."""
-        from ab_cli.utils import require_git_repo
-
         monkeypatch.chdir(tmp_path)
         with pytest.raises(GitError) as exc_info:
             require_git_repo()
 
         assert "Not inside a git repository" in str(exc_info.value)
-
-
-class TestUtilsModuleExports:
-    """Tests for exports from utils module."""
-
-    def test_error_handling_exported_from_utils(self):
-        """Error handling functions are exported from utils."""
-        from ab_cli import utils
-
-        assert hasattr(utils, 'cli_error_handler')
-        assert hasattr(utils, 'handle_cli_errors')
-        assert hasattr(utils, 'require_git_repo')
@@ -1,12 +1,21 @@
 """Unit tests for ab_cli.commands.models module."""
-import json
+import importlib.util
+import os
+import subprocess
 import sys
 from argparse import Namespace
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import orjson
 import pytest
 
 from ab_cli.commands.models import (
+    GREEN,
+    NC,
+    _build_search_index,
+    _use_color,
     cmd_info,
     cmd_list,
     fetch_models,
@@ -19,115 +28,108 @@ from ab_cli.commands.models import (
     truncate,
 )
 
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
 
-# Sample model data for testing
-SAMPLE_MODELS = [
-    {
-        "id": "openai/gpt-4o",
-        "name": "GPT-4o",
-        "description": "OpenAI's most advanced multimodal model",
-        "context_length": 128000,
-        "pricing": {"prompt": "0.0000025", "completion": "0.00001"},
-        "architecture": {
-            "input_modalities": ["text", "image"],
-            "output_modalities": ["text"],
-        },
-        "top_provider": {"max_completion_tokens": 16384},
-        "supported_parameters": ["temperature", "top_p", "max_tokens"],
-    },
-    {
-        "id": "anthropic/claude-3-haiku",
-        "name": "Claude 3 Haiku",
-        "description": "Fast and efficient Claude model",
-        "context_length": 200000,
-        "pricing": {"prompt": "0.00000025", "completion": "0.00000125"},
-        "architecture": {
-            "input_modalities": ["text", "image"],
-            "output_modalities": ["text"],
-        },
-        "top_provider": {"max_completion_tokens": 4096},
-        "supported_parameters": ["temperature", "top_p"],
-    },
-    {
-        "id": "meta-llama/llama-3-8b:free",
-        "name": "Llama 3 8B",
-        "description": "Free Llama model",
-        "context_length": 8192,
-        "pricing": {"prompt": "0", "completion": "0"},
-        "architecture": {
-            "input_modalities": ["text"],
-            "output_modalities": ["text"],
-        },
-        "top_provider": {"max_completion_tokens": 2048},
-        "supported_parameters": ["temperature"],
-    },
-    {
-        "id": "google/gemini-pro-vision",
-        "name": "Gemini Pro Vision",
-        "description": "Google's vision model",
-        "context_length": 32000,
-        "pricing": {"prompt": "0.00000025", "completion": "0.0000005"},
-        "architecture": {
-            "input_modalities": ["text", "image", "video"],
-            "output_modalities": ["text"],
-        },
-        "top_provider": {"max_completion_tokens": 8192},
-        "supported_parameters": ["temperature", "top_p"],
-    },
-]
+# Defaults of the "ab models list" options; tests override single fields
+_LIST_DEFAULTS = dict(free=False, search=None, context_min=None, modality=None,
+                      limit=50, sort="name", json=False)
 
 
-class TestFormatPrice:
-    """Tests for format_price function."""
+@pytest.fixture(scope="session")
+def models_response_body(sample_models) -> bytes:
+    """The sample models as an OpenRouter /models response body, serialized once."""
+    return orjson.dumps({"data": [dict(m) for m in sample_models]})
 
-    def test_format_price_free(self):
-        """Returns FREE for zero pricing."""
-        pricing = {"prompt": "0", "completion": "0"}
-        result = format_price(pricing)
-        assert "FREE" in result
 
-    def test_format_price_paid(self):
-        """Formats paid pricing correctly."""
-        pricing = {"prompt": "0.0000025", "completion": "0.00001"}
-        result = format_price(pricing)
-        # Remove ANSI codes for comparison
-        clean_result = result.replace("\033[0;32m", "").replace("\033[0m", "")
-        assert "$2.50" in clean_result
-        assert "$10.00" in clean_result
+def _make_models(n):
+    """Build n synthetic model entries; every seventh one is free."""
+    return [
+        {
+            "id": f"p/m-{i}",
+            "name": f"Model {i}",
+            "description": "Synthetic test model",
+            "context_length": (i % 8 + 1) * 8192,
+            "pricing": {"prompt": "0" if i % 7 == 0 else "0.000001", "completion": "0"},
+            "architecture": {"input_modalities": ["text"]},
+            "top_provider": {},
+            "supported_parameters": [],
+        }
+        for i in range(n)
+    ]
 
-    def test_format_price_none(self):
-        """Returns N/A for None pricing."""
-        result = format_price(None)
-        assert result == "N/A"
 
-    def test_format_price_empty(self):
-        """Returns N/A for empty pricing dict."""
-        result = format_price({})
-        assert result == "N/A"  # Empty dict is falsy, returns N/A
+class TestFormatPrice:
+    """Tests for format_price function."""
+
+    @pytest.mark.parametrize("pricing,expected", [
+        ({"prompt": "0", "completion": "0"}, f"{GREEN}FREE{NC}"),
+        ({"prompt": "0.0000025", "completion": "0.00001"}, "$2.50 / $10.00"),
+        (None, "N/A"),
+        ({}, "N/A"),  # Empty dict is falsy, returns N/A
+    ], ids=["free", "paid", "none", "empty"])
+    def test_format_price(self, pricing, expected):
+        """Formats per-1M pricing, FREE for zero and N/A when missing."""
+        assert format_price(pricing) == expected
+
+
+class TestUseColor:
+    """Tests for the color switch behind the module's ANSI constants."""
+
+    @pytest.mark.parametrize("no_color,isatty,expected", [
+        (None, True, True),
+        (None, False, False),
+        ("1", True, False),
+    ], ids=["tty", "redirected", "no-color"])
+    def test_use_color(self, monkeypatch, no_color, isatty, expected):
+        """Colors only on a terminal and only without NO_COLOR."""
+        if no_color is None:
+            monkeypatch.delenv("NO_COLOR", raising=False)
+        else:
+            monkeypatch.setenv("NO_COLOR", no_color)
+        stream = SimpleNamespace(isatty=lambda: isatty)
+        assert _use_color(stream) is expected
+
+    def test_stderr_colored_independently_of_stdout(self, monkeypatch):
+        """log_error keeps its color on a terminal stderr while stdout is piped."""
+        pty = pytest.importorskip("pty")
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        master, slave = pty.openpty()
+        proc = subprocess.Popen(
+            [sys.executable, "-c",
+             "from ab_cli.commands import models; models.log_error('boom'); print(repr(models.RED))"],
+            stdout=subprocess.PIPE,
+            stderr=slave,
+            env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        )
+        os.close(slave)
+        out, _ = proc.communicate(timeout=30)
+        err = b""
+        while True:
+            try:
+                chunk = os.read(master, 4096)
+            except OSError:  # EIO once the child has closed the terminal
+                break
+            if not chunk:
+                break
+            err += chunk
+        os.close(master)
+
+        assert out.decode().strip() == "''"
+        assert b"\x1b[0;31m[ERROR]\x1b[0m boom" in err
 
 
 class TestFormatContext:
     """Tests for format_context function."""
 
-    def test_format_context_millions(self):
-        """Formats millions correctly."""
-        result = format_context(1000000)
-        assert result == "1.0M"
-
-    def test_format_context_thousands(self):
-        """Formats thousands correctly."""
-        result = format_context(128000)
-        assert result == "128k"
-
-    def test_format_context_small(self):
-        """Formats small values correctly."""
-        result = format_context(512)
-        assert result == "512"
-
-    def test_format_context_none(self):
-        """Returns N/A for None."""
-        result = format_context(None)
-        assert result == "N/A"
+    @pytest.mark.parametrize("value,expected", [
+        (1_000_000, "1.0M"),
+        (128_000, "128k"),
+        (512, "512"),
+        (None, "N/A"),
+    ], ids=["millions", "thousands", "small", "none"])
+    def test_format_context(self, value, expected):
+        """Formats context length with M/k suffixes."""
+        assert format_context(value) == expected
 
 
 class TestGetModalities:
@@ -156,92 +158,108 @@ class TestGetModalities:
 class TestTruncate:
     """Tests for truncate function."""
 
-    def test_truncate_short(self):
-        """Doesn't truncate short text."""
-        result = truncate("hello", 10)
-        assert result == "hello"
-
-    def test_truncate_exact(self):
-        """Doesn't truncate exact length."""
-        result = truncate("hello", 5)
-        assert result == "hello"
-
-    def test_truncate_long(self):
-        """Truncates long text with ellipsis."""
-        result = truncate("hello world", 8)
-        assert result == "hello..."
-        assert len(result) == 8
+    @pytest.mark.parametrize("text,max_len,expected", [
+        ("hello", 10, "hello"),
+        ("hello", 5, "hello"),
+        ("hello world", 8, "hello..."),
+    ], ids=["short", "exact", "long"])
+    def test_truncate(self, text, max_len, expected):
+        """Truncates only text longer than max_len, ending in an ellipsis."""
+        result = truncate(text, max_len)
+        assert result == expected
+        assert len(result) <= max_len
 
 
 class TestFilterModels:
     """Tests for filter_models function."""
 
-    def test_filter_free(self):
+    def test_filter_free(self, sample_models):
         """Filters free models."""
-        args = Namespace(free=True, search=None, context_min=None, modality=None)
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 1
-        assert result[0]["id"] == "meta-llama/llama-3-8b:free"
+        args = Namespace(**{**_LIST_DEFAULTS, "free": True})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"meta-llama/llama-3-8b:free"}
 
-    def test_filter_search(self):
+    def test_filter_search(self, sample_models):
         """Filters by search term."""
-        args = Namespace(free=False, search="claude", context_min=None, modality=None)
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 1
-        assert result[0]["id"] == "anthropic/claude-3-haiku"
+        args = Namespace(**{**_LIST_DEFAULTS, "search": "claude"})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"anthropic/claude-3-haiku"}
 
-    def test_filter_search_case_insensitive(self):
+    def test_filter_search_case_insensitive(self, sample_models):
         """Search is case insensitive."""
-        args = Namespace(free=False, search="GPT", context_min=None, modality=None)
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 1
-        assert result[0]["id"] == "openai/gpt-4o"
+        args = Namespace(**{**_LIST_DEFAULTS, "search": "GPT"})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"openai/gpt-4o"}
 
-    def test_filter_context_min(self):
+    def test_filter_search_does_not_span_fields(self, sample_models):
+        """A term never matches across the end of one field and the start of the next."""
+        args = Namespace(**{**_LIST_DEFAULTS, "search": "gpt-4o gpt"})
+        assert filter_models(sample_models, args) == []
+
+    def test_search_index_lowercases_once_per_model(self):
+        """Each model is paired with its id, name and description, lowercased."""
+        models = [{"id": "A/B", "name": None, "description": "Fast MODEL"}]
+        assert _build_search_index(models) == [(models[0], "a/b\n\nfast model")]
+
+    def test_filter_context_min(self, sample_models):
         """Filters by minimum context."""
-        args = Namespace(free=False, search=None, context_min=100000, modality=None)
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 2
-        assert all(m["context_length"] >= 100000 for m in result)
+        args = Namespace(**{**_LIST_DEFAULTS, "context_min": 100000})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"openai/gpt-4o", "anthropic/claude-3-haiku"}
 
-    def test_filter_modality(self):
+    def test_filter_modality(self, sample_models):
         """Filters by modality."""
-        args = Namespace(free=False, search=None, context_min=None, modality="video")
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 1
-        assert result[0]["id"] == "google/gemini-pro-vision"
+        args = Namespace(**{**_LIST_DEFAULTS, "modality": "video"})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"google/gemini-pro-vision"}
 
-    def test_filter_combined(self):
+    def test_filter_combined(self, sample_models):
         """Combines multiple filters."""
-        args = Namespace(free=False, search=None, context_min=100000, modality="image")
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 2
+        args = Namespace(**{**_LIST_DEFAULTS, "context_min": 100000, "modality": "image"})
+        result = filter_models(sample_models, args)
+        assert {m["id"] for m in result} == {"openai/gpt-4o", "anthropic/claude-3-haiku"}
 
-    def test_filter_no_matches(self):
+    def test_filter_no_matches(self, sample_models):
         """Returns empty for no matches."""
-        args = Namespace(free=True, search="nonexistent", context_min=None, modality=None)
-        result = filter_models(SAMPLE_MODELS, args)
-        assert len(result) == 0
+        args = Namespace(**{**_LIST_DEFAULTS, "free": True, "search": "nonexistent"})
+        result = filter_models(sample_models, args)
+        assert result == []
+
+    @pytest.mark.parametrize("n", [1, 10, 1000])
+    def test_filter_many_models(self, n):
+        """Search and free filters stay exact on larger synthetic lists."""
+        models = _make_models(n)
+        args = Namespace(**{**_LIST_DEFAULTS, "free": True, "search": "MODEL"})
+        assert filter_models(models, args) == models[::7]
+
+    @pytest.mark.skipif(importlib.util.find_spec("pytest_benchmark") is None,
+                        reason="pytest-benchmark not installed")
+    def test_filter_models_perf(self, benchmark):
+        """Benchmark a search over 1000 models."""
+        models = _make_models(1000)
+        args = Namespace(**{**_LIST_DEFAULTS, "search": "model 5"})
+        result = benchmark(filter_models, models, args)
+        assert len(result) == 111  # Model 5, 50-59, 500-599
 
 
 class TestSortModels:
     """Tests for sort_models function."""
 
-    def test_sort_by_name(self):
+    def test_sort_by_name(self, sample_models):
         """Sorts by name alphabetically."""
-        result = sort_models(SAMPLE_MODELS, "name")
+        result = sort_models(sample_models, "name")
         names = [m["name"] for m in result]
         assert names == sorted(names, key=str.lower)
 
-    def test_sort_by_context(self):
+    def test_sort_by_context(self, sample_models):
         """Sorts by context length descending."""
-        result = sort_models(SAMPLE_MODELS, "context")
+        result = sort_models(sample_models, "context")
         contexts = [m["context_length"] for m in result]
         assert contexts == sorted(contexts, reverse=True)
 
-    def test_sort_by_price(self):
+    def test_sort_by_price(self, sample_models):
         """Sorts by price ascending."""
-        result = sort_models(SAMPLE_MODELS, "price")
+        result = sort_models(sample_models, "price")
         # Free model should be first
         assert result[0]["id"] == "meta-llama/llama-3-8b:free"
 
@@ -249,17 +267,19 @@ class TestSortModels:
 class TestFetchModels:
     """Tests for fetch_models function."""
 
-    def test_fetch_models_success(self):
+    def test_fetch_models_success(self, sample_models, models_response_body):
         """Successfully fetches models."""
         with patch("requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"data": SAMPLE_MODELS}
-            mock_get.return_value = mock_response
+            # Each json() call decodes a fresh, mutation-safe copy
+            mock_get.return_value = SimpleNamespace(
+                status_code=200,
+                raise_for_status=lambda: None,
+                json=lambda: orjson.loads(models_response_body),
+            )
 
             result = fetch_models("https://api.test.com", "test-key")
 
-            assert result == SAMPLE_MODELS
+            assert result == list(sample_models)
             mock_get.assert_called_once()
 
     def test_fetch_models_error(self, capsys):
@@ -279,60 +299,30 @@ class TestFetchModels:
 class TestCmdList:
     """Tests for cmd_list command."""
 
-    def test_cmd_list_success(self, mock_config, mock_env, capsys):
+    def test_cmd_list_success(self, mock_config, mock_env, capsys, mock_fetch):
         """Lists models successfully."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-
-            args = Namespace(
-                free=False,
-                search=None,
-                context_min=None,
-                modality=None,
-                limit=50,
-                sort="name",
-                json=False,
-            )
-            cmd_list(args)
+        args = Namespace(**_LIST_DEFAULTS)
+        cmd_list(args)
 
-            captured = capsys.readouterr()
-            assert "openai/gpt-4o" in captured.out
-            assert "GPT-4o" in captured.out
+        captured = capsys.readouterr()
+        assert "openai/gpt-4o" in captured.out
+        assert "GPT-4o" in captured.out
 
-    def test_cmd_list_json(self, mock_config, mock_env, capsys):
+    def test_cmd_list_json(self, mock_config, mock_env, capsys, mock_fetch):
         """Outputs JSON when requested."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-
-            args = Namespace(
-                free=False,
-                search=None,
-                context_min=None,
-                modality=None,
-                limit=50,
-                sort="name",
-                json=True,
-            )
-            cmd_list(args)
+        args = Namespace(**{**_LIST_DEFAULTS, "json": True})
+        cmd_list(args)
 
-            captured = capsys.readouterr()
-            output = json.loads(captured.out)
-            assert isinstance(output, list)
-            assert len(output) == len(SAMPLE_MODELS)
+        captured = capsys.readouterr()
+        output = orjson.loads(captured.out)
+        assert isinstance(output, list)
+        assert len(output) == len(mock_fetch.return_value)
 
     def test_cmd_list_no_api_key(self, mock_config, capsys, monkeypatch):
         """Exits with error when no API key."""
         monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
 
-        args = Namespace(
-            free=False,
-            search=None,
-            context_min=None,
-            modality=None,
-            limit=50,
-            sort="name",
-            json=False,
-        )
+        args = Namespace(**_LIST_DEFAULTS)
 
         with pytest.raises(SystemExit) as exc_info:
             cmd_list(args)
@@ -341,151 +331,107 @@ class TestCmdList:
         captured = capsys.readouterr()
         assert "not set" in captured.err
 
-    def test_cmd_list_with_limit(self, mock_config, mock_env, capsys):
+    def test_cmd_list_with_limit(self, mock_config, mock_env, capsys, mock_fetch):
         """Respects limit parameter."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-
-            args = Namespace(
-                free=False,
-                search=None,
-                context_min=None,
-                modality=None,
-                limit=2,
-                sort="name",
-                json=True,
-            )
-            cmd_list(args)
+        args = Namespace(**{**_LIST_DEFAULTS, "limit": 2, "json": True})
+        cmd_list(args)
 
-            captured = capsys.readouterr()
-            output = json.loads(captured.out)
-            assert len(output) == 2
+        captured = capsys.readouterr()
+        # Counting is enough here; test_cmd_list_json checks the output parses
+        assert captured.out.count('"id": ') == 2
 
 
 class TestCmdInfo:
     """Tests for cmd_info command."""
 
-    def test_cmd_info_exact_match(self, mock_config, mock_env, capsys):
+    def test_cmd_info_exact_match(self, mock_config, mock_env, capsys, mock_fetch):
         """Shows info for exact model ID match."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
+        args = Namespace(model_id="openai/gpt-4o", json=False)
+        cmd_info(args)
 
-            args = Namespace(model_id="openai/gpt-4o", json=False)
-            cmd_info(args)
-
-            captured = capsys.readouterr()
-            assert "openai/gpt-4o" in captured.out
-            assert "GPT-4o" in captured.out
-            assert "128,000" in captured.out
+        captured = capsys.readouterr()
+        assert "openai/gpt-4o" in captured.out
+        assert "GPT-4o" in captured.out
+        assert "128,000" in captured.out
 
-    def test_cmd_info_partial_match(self, mock_config, mock_env, capsys):
+    def test_cmd_info_partial_match(self, mock_config, mock_env, capsys, mock_fetch):
         """Finds model with partial ID match."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
+        args = Namespace(model_id="gpt-4o", json=False)
+        cmd_info(args)
 
-            args = Namespace(model_id="gpt-4o", json=False)
-            cmd_info(args)
-
-            captured = capsys.readouterr()
-            assert "openai/gpt-4o" in captured.out
+        captured = capsys.readouterr()
+        assert "openai/gpt-4o" in captured.out
 
-    def test_cmd_info_not_found(self, mock_config, mock_env, capsys):
+    def test_cmd_info_not_found(self, mock_config, mock_env, capsys, mock_fetch):
         """Exits with error when model not found."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
+        args = Namespace(model_id="nonexistent/model", json=False)
 
-            args = Namespace(model_id="nonexistent/model", json=False)
-
-            with pytest.raises(SystemExit) as exc_info:
-                cmd_info(args)
+        with pytest.raises(SystemExit) as exc_info:
+            cmd_info(args)
 
-            assert exc_info.value.code == 1
-            captured = capsys.readouterr()
-            assert "not found" in captured.err
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "not found" in captured.err
 
-    def test_cmd_info_json(self, mock_config, mock_env, capsys):
+    def test_cmd_info_json(self, mock_config, mock_env, capsys, mock_fetch):
         """Outputs JSON when requested."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-
-            args = Namespace(model_id="openai/gpt-4o", json=True)
-            cmd_info(args)
+        args = Namespace(model_id="openai/gpt-4o", json=True)
+        cmd_info(args)
 
-            captured = capsys.readouterr()
-            output = json.loads(captured.out)
-            assert output["id"] == "openai/gpt-4o"
-            assert output["name"] == "GPT-4o"
+        captured = capsys.readouterr()
+        output = orjson.loads(captured.out)
+        assert output["id"] == "openai/gpt-4o"
+        assert output["name"] == "GPT-4o"
 
-    def test_cmd_info_multiple_matches(self, mock_config, mock_env, capsys):
+    def test_cmd_info_multiple_matches(self, mock_config, mock_env, capsys, mock_fetch):
         """Exits with error for ambiguous partial match."""
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-
-            # "a" matches multiple models (llama, gemma, etc.)
-            args = Namespace(model_id="llama", json=False)
-            cmd_info(args)
+        # "a" matches multiple models (llama, gemma, etc.)
+        args = Namespace(model_id="llama", json=False)
+        cmd_info(args)
 
-            # Should succeed because only one llama model
-            captured = capsys.readouterr()
-            assert "Llama" in captured.out
+        # Should succeed because only one llama model
+        captured = capsys.readouterr()
+        assert "Llama" in captured.out
 
 
 class TestMain:
     """Tests for main() entry point."""
 
-    def test_main_no_command_defaults_to_list(self, mock_config, mock_env, capsys, monkeypatch):
+    def test_main_no_command_defaults_to_list(self, mock_config, mock_env, capsys, mock_fetch):
         """No command defaults to list."""
-        monkeypatch.setattr(sys, "argv", ["ab-models"])
+        main([])
 
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-            main()
-
-            captured = capsys.readouterr()
-            assert "openai/gpt-4o" in captured.out
+        captured = capsys.readouterr()
+        assert "openai/gpt-4o" in captured.out
 
-    def test_main_list_command(self, mock_config, mock_env, capsys, monkeypatch):
+    def test_main_list_command(self, mock_config, mock_env, capsys, mock_fetch):
         """'list' command works."""
-        monkeypatch.setattr(sys, "argv", ["ab-models", "list", "--limit", "2"])
-
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-            main()
+        main(["list", "--limit", "2"])
 
-            captured = capsys.readouterr()
-            # Should show table output
-            assert "ID" in captured.out or "openai" in captured.out
+        captured = capsys.readouterr()
+        # Should show table output
+        assert "ID" in captured.out or "openai" in captured.out
 
-    def test_main_list_free(self, mock_config, mock_env, capsys, monkeypatch):
+    def test_main_list_free(self, mock_config, mock_env, capsys, mock_fetch):
         """'list --free' filters correctly."""
-        monkeypatch.setattr(sys, "argv", ["ab-models", "list", "--free", "--json"])
+        main(["list", "--free", "--json"])
 
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-            main()
-
-            captured = capsys.readouterr()
-            output = json.loads(captured.out)
-            assert len(output) == 1
-            assert output[0]["id"] == "meta-llama/llama-3-8b:free"
+        captured = capsys.readouterr()
+        output = orjson.loads(captured.out)
+        assert len(output) == 1
+        assert output[0]["id"] == "meta-llama/llama-3-8b:free"
 
-    def test_main_info_command(self, mock_config, mock_env, capsys, monkeypatch):
+    def test_main_info_command(self, mock_config, mock_env, capsys, mock_fetch):
         """'info' command works."""
-        monkeypatch.setattr(sys, "argv", ["ab-models", "info", "openai/gpt-4o"])
-
-        with patch("ab_cli.commands.models.fetch_models") as mock_fetch:
-            mock_fetch.return_value = SAMPLE_MODELS
-            main()
+        main(["info", "openai/gpt-4o"])
 
-            captured = capsys.readouterr()
-            assert "GPT-4o" in captured.out
+        captured = capsys.readouterr()
+        assert "GPT-4o" in captured.out
 
-    def test_main_help(self, capsys, monkeypatch):
+    def test_main_help(self, capsys):
         """'--help' shows help."""
-        monkeypatch.setattr(sys, "argv", ["ab-models", "--help"])
-
         with pytest.raises(SystemExit) as exc_info:
-            main()
+            main(["--help"])
 
         assert exc_info.value.code == 0
         captured = capsys.readouterr()
@@ -0,0 +1,134 @@
+"""Unit tests for git output parsing used by ab_cli.commands.rewrite_history.
+
+subprocess.run is replaced with canned git output, so no repository is needed.
+"""
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ab_cli.commands.rewrite_history import (
+    check_commits_pushed,
+    count_words,
+    get_commit_files,
+    get_commit_message,
+    get_commit_subject,
+    get_short_hash,
+    has_remotes,
+    is_merge_commit,
+    list_commits,
+)
+
+
+@pytest.fixture
+def fake_git():
+    """Patch subprocess.run for git helpers; set .return_value.stdout per test."""
+    with patch("ab_cli.utils.git_helpers.subprocess.run") as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["git"], returncode=0, stdout="", stderr=""
+        )
+        yield mock_run
+
+
+def git_args(mock_run):
+    """Return the git arguments of the last call, without the 'git' prefix."""
+    return mock_run.call_args[0][0][1:]
+
+
+class TestIsMergeCommit:
+    """Tests for is_merge_commit parsing."""
+
+    def test_single_parent_is_not_merge(self, fake_git):
+        """One parent hash means a regular commit."""
+        fake_git.return_value.stdout = "abc123 parent1\n"
+        assert is_merge_commit("abc123") is False
+
+    def test_root_commit_is_not_merge(self, fake_git):
+        """No parent hash means a root commit."""
+        fake_git.return_value.stdout = "abc123\n"
+        assert is_merge_commit("abc123") is False
+
+    def test_two_parents_is_merge(self, fake_git):
+        """Two parent hashes means a merge commit."""
+        fake_git.return_value.stdout = "abc123 parent1 parent2\n"
+        assert is_merge_commit("abc123") is True
+        assert git_args(fake_git) == ["rev-list", "--parents", "-n", "1", "abc123"]
+
+
+class TestCommitInfo:
+    """Tests for commit message/subject/hash getters."""
+
+    def test_get_commit_message(self, fake_git):
+        """Returns the full message without trailing whitespace."""
+        fake_git.return_value.stdout = "Initial commit\n\nBody line\n\n"
+        assert get_commit_message("abc123") == "Initial commit\n\nBody line"
+        assert git_args(fake_git) == ["log", "-1", "--format=%B", "abc123"]
+
+    def test_get_commit_subject(self, fake_git):
+        """Returns the subject line."""
+        fake_git.return_value.stdout = "Initial commit\n"
+        assert get_commit_subject("abc123") == "Initial commit"
+        assert git_args(fake_git) == ["log", "-1", "--format=%s", "abc123"]
+
+    def test_get_short_hash(self, fake_git):
+        """Returns git's abbreviated hash."""
+        fake_git.return_value.stdout = "abc1234\n"
+        assert get_short_hash("abc1234def") == "abc1234"
+        assert git_args(fake_git) == ["log", "-1", "--format=%h", "abc1234def"]
+
+    def test_get_commit_files(self, fake_git):
+        """Returns the name-status listing."""
+        fake_git.return_value.stdout = "A\ttestfile.txt\nM\tREADME.md\n"
+        assert get_commit_files("abc123") == "A\ttestfile.txt\nM\tREADME.md"
+
+
+class TestListCommits:
+    """Tests for list_commits parsing."""
+
+    def test_list_commits_range(self, fake_git):
+        """Splits rev-list output into hashes."""
+        fake_git.return_value.stdout = "aaa\nbbb\nccc\n"
+        assert list_commits("HEAD~3..HEAD") == ["aaa", "bbb", "ccc"]
+        assert git_args(fake_git) == ["rev-list", "--reverse", "HEAD~3..HEAD"]
+
+    def test_list_commits_root_uses_head(self, fake_git):
+        """'--root' lists every commit reachable from HEAD."""
+        fake_git.return_value.stdout = "aaa\n"
+        assert list_commits("--root") == ["aaa"]
+        assert git_args(fake_git) == ["rev-list", "--reverse", "HEAD"]
+
+    def test_list_commits_empty(self, fake_git):
+        """Empty output yields an empty list."""
+        assert list_commits("HEAD..HEAD") == []
+
+
+class TestRemotes:
+    """Tests for remote detection."""
+
+    def test_has_remotes_false(self, fake_git):
+        """No output means no remotes."""
+        assert has_remotes() is False
+
+    def test_has_remotes_true(self, fake_git):
+        """Any remote name means remotes exist."""
+        fake_git.return_value.stdout = "origin\n"
+        assert has_remotes() is True
+
+    def test_check_commits_pushed_no_remotes(self, fake_git):
+        """Returns False without running git when there are no remotes."""
+        with patch("ab_cli.utils.git_helpers.has_remotes", return_value=False):
+            assert check_commits_pushed("deadbeef") is False
+        fake_git.assert_not_called()
+
+
+class TestCountWords:
+    """Tests for word counting utility."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("one two three", 3),
+        ("", 0),
+        ("line one\nline two", 4),
+    ], ids=["simple", "empty", "multiline"])
+    def test_count_words(self, text, expected):
+        """Counts whitespace-separated words."""
+        assert count_words(text) == expected
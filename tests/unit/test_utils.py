@@ -1,10 +1,11 @@
 """Unit tests for utility functions across ab_cli modules."""
-import subprocess
+import pytest
 
 
 class TestAutoCommitGitHelpers:
     """Tests for git helper functions (now in utils module)."""
 
+    @pytest.mark.git
     def test_run_git_success(self):
         """run_git executes git command."""
         from ab_cli.utils import run_git
@@ -13,13 +14,22 @@ class TestAutoCommitGitHelpers:
         assert result.returncode == 0
         assert "git version" in result.stdout
 
-    def test_is_git_repo_true(self, mock_git_repo, monkeypatch):
+    def test_run_git_cwd(self, git_repo_template):
+        """run_git runs in the given directory without changing the process cwd."""
+        from ab_cli.utils import run_git
+
+        result = run_git("rev-parse", "--show-toplevel", cwd=str(git_repo_template))
+        assert result.stdout.strip() == str(git_repo_template)
+
+    def test_is_git_repo_true(self, git_repo_template, monkeypatch):
         """is_git_repo returns True inside repo."""
         from ab_cli.utils import is_git_repo
 
-        monkeypatch.chdir(mock_git_repo)
+        # Read-only check, so the session template needs no private copy
+        monkeypatch.chdir(git_repo_template)
         assert is_git_repo() is True
 
+    @pytest.mark.git
     def test_is_git_repo_false(self, tmp_path, monkeypatch):
         """is_git_repo returns False outside repo."""
         from ab_cli.utils import is_git_repo
@@ -27,30 +37,20 @@ class TestAutoCommitGitHelpers:
         monkeypatch.chdir(tmp_path)
         assert is_git_repo() is False
 
-    def test_get_staged_files(self, mock_git_repo, monkeypatch):
+    def test_get_staged_files(self, staged_git_repo, monkeypatch):
         """get_staged_files returns staged file list."""
         from ab_cli.utils import get_staged_files
 
-        monkeypatch.chdir(mock_git_repo)
-
-        # Create and stage a file
-        test_file = mock_git_repo / "test.txt"
-        test_file.write_text("test content")
-        subprocess.run(["git", "add", "test.txt"], cwd=mock_git_repo, check=True)
+        monkeypatch.chdir(staged_git_repo)
 
         result = get_staged_files()
-        assert "test.txt" in result
+        assert result.splitlines() == ["other.txt", "test.txt"]
 
-    def test_get_staged_diff(self, mock_git_repo, monkeypatch):
+    def test_get_staged_diff(self, staged_git_repo, monkeypatch):
         """get_staged_diff returns diff content."""
         from ab_cli.utils import get_staged_diff
 
-        monkeypatch.chdir(mock_git_repo)
-
-        # Create and stage a file
-        test_file = mock_git_repo / "test.txt"
-        test_file.write_text("test content")
-        subprocess.run(["git", "add", "test.txt"], cwd=mock_git_repo, check=True)
+        monkeypatch.chdir(staged_git_repo)
 
         result = get_staged_diff()
         assert "+test content" in result
@@ -67,84 +67,3 @@ class TestAutoCommitGitHelpers:
         result = get_repo_root()
         assert result == str(mock_git_repo)
 
-
-class TestPrDescriptionUtils:
-    """Tests for utility functions in pr_description module."""
-
-    def test_count_words(self):
-        """Word counting works correctly."""
-        # The pr_description module doesn't have count_words,
-        # but we can test similar logic if needed
-        text = "this is a test"
-        assert len(text.split()) == 4
-
-    def test_parse_pr_response(self):
-        """PR response parsing extracts title and body."""
-        response = """TITLE: Add new feature
-
-DESCRIPTION:
-This PR adds a new feature that does something useful.
-
-- Added feature X
-- Fixed bug Y
-"""
-        # Test basic parsing logic
-        lines = response.strip().split("\n")
-        title_line = next((line for line in lines if line.startswith("TITLE:")), None)
-        assert title_line is not None
-        assert "Add new feature" in title_line
-
-
-class TestPromptUtils:
-    """Tests for utility functions in prompt module."""
-
-    def test_specialist_prefix_dev(self):
-        """Dev specialist returns appropriate prefix."""
-        # Test the concept - actual implementation may vary
-        dev_prompts = ["developer", "software engineer", "coder"]
-        assert any(term in "developer" for term in dev_prompts)
-
-    def test_specialist_prefix_rm(self):
-        """RM specialist returns appropriate prefix."""
-        rm_prompts = ["release manager", "project manager"]
-        assert any(term in "release manager" for term in rm_prompts)
-
-
-class TestLoggingHelpers:
-    """Tests for logging helper functions (now in utils module)."""
-
-    def test_log_info(self, capsys):
-        """log_info prints info message."""
-        from ab_cli.utils import log_info
-
-        log_info("Test message")
-        captured = capsys.readouterr()
-        assert "Test message" in captured.out
-        assert "[INFO]" in captured.out
-
-    def test_log_success(self, capsys):
-        """log_success prints success message."""
-        from ab_cli.utils import log_success
-
-        log_success("Success message")
-        captured = capsys.readouterr()
-        assert "Success message" in captured.out
-        assert "[SUCCESS]" in captured.out
-
-    def test_log_warning(self, capsys):
-        """log_warning prints warning message."""
-        from ab_cli.utils import log_warning
-
-        log_warning("Warning message")
-        captured = capsys.readouterr()
-        assert "Warning message" in captured.out
-        assert "[WARNING]" in captured.out
-
-    def test_log_error(self, capsys):
-        """log_error prints error to stderr."""
-        from ab_cli.utils import log_error
-
-        log_error("Error message")
-        captured = capsys.readouterr()
-        assert "Error message" in captured.err
-        assert "[ERROR]" in captured.err
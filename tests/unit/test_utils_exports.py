@@ -0,0 +1,33 @@
+"""Unit tests for the names re-exported by the ab_cli.utils package."""
+import pytest
+
+from ab_cli import utils
+from ab_cli.utils import error_handling, exceptions, git_helpers, logging
+
+EXPORTS = [
+    (logging, "log_info"),
+    (logging, "log_success"),
+    (logging, "log_warning"),
+    (logging, "log_error"),
+    (logging, "log_debug"),
+    (logging, "RED"),
+    (logging, "GREEN"),
+    (logging, "YELLOW"),
+    (logging, "BLUE"),
+    (logging, "CYAN"),
+    (logging, "NC"),
+    (exceptions, "AbCliError"),
+    (exceptions, "GitError"),
+    (exceptions, "LLMError"),
+    (exceptions, "ConfigError"),
+    (exceptions, "FileOperationError"),
+    (error_handling, "cli_error_handler"),
+    (error_handling, "handle_cli_errors"),
+    (git_helpers, "require_git_repo"),
+]
+
+
+@pytest.mark.parametrize("module,name", EXPORTS, ids=[name for _, name in EXPORTS])
+def test_utils_reexports(module, name):
+    """ab_cli.utils exposes the same object as the module that defines it."""
+    assert getattr(utils, name) is getattr(module, name)